@@ -6,21 +6,47 @@ BINANCE TRADING BOT LAUNCHER
 Single command to run the bot with web monitoring
 """
 
+import hashlib
+import importlib.util
 import os
 import sys
 import subprocess
 import time
-import webbrowser
 import socket
 from pathlib import Path
 
 from runtime_config import TESTNET_BASE_URL, TESTNET_FUTURES_URL, get_binance_credentials
 
+# Make trading-bot modules importable once for the whole launcher
+BOT_DIR = Path(__file__).parent / 'trading-bot'
+if str(BOT_DIR) not in sys.path:
+    sys.path.insert(0, str(BOT_DIR))
+
+from environment import USE_TESTNET
+
+REQUIREMENTS_FILE = Path(__file__).parent / 'requirements.txt'
+# Written after a successful requirements check; holds deps_fingerprint()
+DEPS_SENTINEL = Path(__file__).parent / '.binance_bot_deps_ok'
+# (package, import name) for what the bot and dashboard import at startup
+REQUIRED_MODULES = [
+    ('python-binance', 'binance'),
+    ('pandas', 'pandas'),
+    ('numpy', 'numpy'),
+    ('ta', 'ta'),
+    ('requests', 'requests'),
+    ('aiohttp', 'aiohttp'),
+    ('orjson', 'orjson'),
+    ('Flask', 'flask'),
+    ('flask-cors', 'flask_cors'),
+]
+
 def check_port(port):
     """Check if a port is available"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = sock.connect_ex(('127.0.0.1', port))
-    sock.close()
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Bound the probe so a filtered port can't stall startup for the OS connect timeout
+        sock.settimeout(0.2)
+        result = sock.connect_ex(('127.0.0.1', port))
+    # 0 means something accepted the connection; refused or timed out means it's free
     return result != 0
 
 def print_banner():
@@ -30,36 +56,52 @@ def print_banner():
     print(" " * 15 + "with Web Monitoring Interface")
     print("=" * 70)
 
+def deps_fingerprint():
+    """Interpreter path plus a hash of requirements.txt; changing either re-runs the check"""
+    try:
+        digest = hashlib.sha256(REQUIREMENTS_FILE.read_bytes()).hexdigest()
+    except OSError:
+        digest = ''
+    return f"{sys.executable}\n{digest}"
+
 def check_requirements():
     """Check if all requirements are installed"""
     print("\n📋 Checking requirements...")
 
+    # A previous launch already verified this interpreter against these requirements
+    fingerprint = deps_fingerprint()
     try:
-        import binance
-        print("  ✅ python-binance installed")
-    except ImportError:
-        print("  ❌ python-binance not found")
-        print("     Installing requirements...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-
-    try:
-        import flask
-        print("  ✅ Flask installed")
-    except ImportError:
-        print("  ❌ Flask not found")
-        print("     Installing Flask...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "flask", "flask-cors"])
+        if DEPS_SENTINEL.read_text() == fingerprint:
+            print("  ✅ Requirements verified previously")
+            return
+    except OSError:
+        pass
+
+    # requirements.txt changed (or this interpreter is new): let pip bring it up to date.
+    # Already-satisfied requirements make this a quick no-op.
+    print("  📦 Installing requirements.txt...")
+    pip_ok = subprocess.run([sys.executable, "-m", "pip", "install", "-r", str(REQUIREMENTS_FILE)]).returncode == 0
+    importlib.invalidate_caches()
+
+    # find_spec only looks the package up on disk, without executing its __init__
+    all_found = True
+    for name, module in REQUIRED_MODULES:
+        if importlib.util.find_spec(module) is None:
+            print(f"  ❌ {name} not found")
+            all_found = False
+    if all_found:
+        print("  ✅ Required packages installed")
+
+    if pip_ok and all_found:
+        try:
+            DEPS_SENTINEL.write_text(fingerprint)
+        except OSError:
+            pass
 
 def check_api_keys():
     """Verify API keys are configured"""
     print("\n🔑 Checking API configuration...")
 
-    # Add trading-bot to path
-    bot_dir = Path(__file__).parent / 'trading-bot'
-    sys.path.insert(0, str(bot_dir))
-
-    from environment import USE_TESTNET
-
     if USE_TESTNET:
         try:
             testnet_api_key, testnet_secret_key = get_binance_credentials(USE_TESTNET)
@@ -82,24 +124,20 @@ def test_binance_connection():
     """Quick connection test"""
     print("\n🌐 Testing Binance connection...")
 
-    bot_dir = Path(__file__).parent / 'trading-bot'
-    sys.path.insert(0, str(bot_dir))
-
     try:
+        # Imported here because check_requirements() may have just installed it
         from binance.client import Client
-        from environment import USE_TESTNET
         api_key, secret_key = get_binance_credentials(USE_TESTNET)
 
         client = Client(api_key, secret_key, testnet=True)
         client.API_URL = TESTNET_BASE_URL
         client.FUTURES_URL = TESTNET_FUTURES_URL
 
-        # Quick ping test
-        client.ping()
+        # futures_account() proves both connectivity and key validity in one round trip
+        account = client.futures_account()
         print("  ✅ Connected to Binance Testnet")
 
         # Get balance
-        account = client.futures_account()
         balance = float(account['totalWalletBalance'])
         print(f"  💰 Balance: {balance:.2f} USDT")
 
@@ -119,8 +157,7 @@ def start_bot():
     print("\n🚀 Starting Trading Bot...")
 
     # Change to bot directory
-    bot_dir = Path(__file__).parent / 'trading-bot'
-    os.chdir(bot_dir)
+    os.chdir(BOT_DIR)
 
     # Check if port is available
     if not check_port(5000):
@@ -136,15 +173,18 @@ def start_bot():
 
     # Start the web server
     try:
-        if os.name == 'nt':  # Windows
-            # Open browser after a delay
-            print("  Opening browser in 5 seconds...")
-            subprocess.Popen(['timeout', '/t', '5', '/nobreak', '>nul', '&&', 'start', 'http://localhost:5000'], shell=True)
-        else:  # Linux/Mac
-            subprocess.Popen(['sh', '-c', 'sleep 5 && xdg-open http://localhost:5000 || open http://localhost:5000'], shell=False)
+        # web_server.py opens the browser on a timer; a launcher-side timer would not survive execv
+        print("  Opening browser in 5 seconds...")
+        os.environ['OPEN_BROWSER_URL'] = 'http://localhost:5000'
 
         # Run the web server
-        subprocess.run([sys.executable, 'web_server.py'])
+        if os.name == 'nt':
+            # execv on Windows spawns a detached child and exits, which breaks Ctrl+C
+            subprocess.run([sys.executable, 'web_server.py'])
+        else:
+            # Replace the launcher so no idle parent interpreter stays resident
+            sys.stdout.flush()
+            os.execv(sys.executable, [sys.executable, 'web_server.py'])
     except KeyboardInterrupt:
         print("\n\n🛑 Bot stopped by user")
     except Exception as e:
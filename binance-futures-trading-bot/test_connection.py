@@ -35,14 +35,10 @@ def test_connection():
             print("ERROR: Not in testnet mode!")
             return False
 
-        # Test connection
-        print("\nTesting API connection...")
-        server_time = client.get_server_time()
-        print(f"✅ Server time: {server_time['serverTime']}")
-
-        # Get account info
-        print("\nGetting account info...")
+        # futures_account() validates connectivity and auth in a single call
+        print("\nTesting API connection and getting account info...")
         account = client.futures_account()
+        print("✅ Connected and authenticated")
 
         print(f"✅ Account balance: {account['totalWalletBalance']} USDT")
         print(f"✅ Available balance: {account['availableBalance']} USDT")
@@ -55,7 +51,8 @@ def test_connection():
 
         # Get active positions
         print("\nActive positions:")
-        positions = [p for p in account['positions'] if float(p['positionAmt']) != 0]
+        # Zero amounts come back as "0", "0.000", "-0.000"...; compare the digits instead of parsing floats
+        positions = [p for p in account['positions'] if p['positionAmt'].lstrip('-').strip('0') not in ('', '.')]
         if positions:
             for pos in positions:
                 print(f"  - {pos['symbol']}: {pos['positionAmt']}")
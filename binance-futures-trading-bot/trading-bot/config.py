@@ -63,6 +63,8 @@ TIMEFRAME_MAP = {
     5: {'entry': '1h', 'trend': '4h'},
     6: {'entry': '2h', 'trend': '4h'},
 }
+# Same combos as a tuple; combo ids are dense from 0, so lookup is a plain index
+TIMEFRAME_MAP_TUPLE = tuple(TIMEFRAME_MAP[i] for i in range(max(TIMEFRAME_MAP) + 1))
 
 # ========================================
 # SAFETY SETTINGS
@@ -101,6 +103,17 @@ API_DELAY = 0.1  # seconds
 WS_RECONNECT_DELAY = 5  # seconds
 WS_MAX_RECONNECT_ATTEMPTS = 10
 
+# ========================================
+# LOOP TIMING & RETENTION
+# ========================================
+# Exit reconciliation pass; TP/SL live on Binance, so this needn't be fast
+TRADING_LOOP_PERIOD_SECONDS = 10
+# Daily cleanup keeps this many days of trades in the database
+TRADE_RETENTION_DAYS = 10
+# Telegram messages are batched over this window into one send
+TELEGRAM_FLUSH_SECONDS = 3.0
+TELEGRAM_MAX_BATCH_CHARS = 3500  # Telegram rejects messages over 4096 chars
+
 # ========================================
 # INDICATOR CALCULATION
 # ========================================
@@ -130,8 +143,13 @@ else:
 # ========================================
 # DO NOT MODIFY BELOW
 # ========================================
+import sys
 from pathlib import Path
 
+# Interned once here; symbols from the exchange are interned on arrival too,
+# so per-coin dict lookups compare by identity
+ACTIVE_COINS = [sys.intern(coin) for coin in ACTIVE_COINS]
+
 BASE_DIR = Path(__file__).resolve().parent
 
 # Auto-generate parameter file paths
@@ -0,0 +1,11 @@
+"""
+NUMERIC CODES
+=============
+Integer codes for trend directions, so hot-path indicator checks compare
+small ints (numpy int8 arrays) instead of strings.
+"""
+
+# Trend / market structure directions
+TREND_BULL = 1
+TREND_BEAR = -1
+TREND_NEUTRAL = 0
@@ -1,37 +1,92 @@
-import json
+import asyncio
+import atexit
+import hashlib
+import hmac
 import os
 import threading
-from datetime import datetime
+import time
+import uuid
+from urllib.parse import urlencode
+
+import aiohttp
+import orjson
 from binance.client import Client
 
 from config import FOLLOWERS_STORAGE_ENABLED
 
 FOLLOWERS_FILE = os.path.join(os.path.dirname(__file__), "followers.json")
+TESTNET_API_URL = "https://testnet.binance.vision/api"
+TESTNET_FUTURES_URL = "https://testnet.binancefuture.com/fapi"
 LOCK = threading.Lock()
 MEMORY_FOLLOWERS = {"followers": []}
 
+# Parsed followers.json plus the mtime it was read at; reads hit memory until
+# the file changes on disk.
+_CACHE = None
+_CACHE_MTIME = 0
+
+# Active follower list reused for ACTIVE_CACHE_SECONDS so an open followed
+# closely by a close doesn't stat/parse followers.json twice. Any follower
+# change resets _ACTIVE_TS.
+_ACTIVE_LIST = []
+_ACTIVE_TS = 0.0
+ACTIVE_CACHE_SECONDS = 1.0
+
+# Mirrored orders are signed here and sent concurrently from one asyncio loop
+# thread over a shared aiohttp session, so mirror latency is the slowest
+# follower's round trip and follower count doesn't cost an OS thread each.
+_MIRROR_LOOP = None
+_MIRROR_LOOP_LOCK = threading.Lock()
+_MIRROR_SESSION = None
+MIRROR_TIMEOUT_SECONDS = 10
+
+# Per-follower HMAC keyed with the secret plus request headers; each mirrored
+# order only copies the keyed state and hashes its own query string.
+_SIGNER_CACHE = {}
+
 
 def _read_followers_file():
+    """Return follower data, re-reading followers.json only when it changed on disk."""
+    global _CACHE, _CACHE_MTIME
     if not FOLLOWERS_STORAGE_ENABLED:
         return {"followers": [dict(f) for f in MEMORY_FOLLOWERS["followers"]]}
-    if not os.path.exists(FOLLOWERS_FILE):
+    try:
+        mtime = os.stat(FOLLOWERS_FILE).st_mtime_ns
+    except FileNotFoundError:
         return {"followers": []}
-    with open(FOLLOWERS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    with open(FOLLOWERS_FILE, "rb") as f:
+        data = orjson.loads(f.read())
+    _CACHE = data
+    _CACHE_MTIME = mtime
+    return data
 
 
 def _write_followers_file(data):
+    """Persist follower data atomically (temp file + rename) and refresh the cache."""
+    global _CACHE, _CACHE_MTIME
     if not FOLLOWERS_STORAGE_ENABLED:
         MEMORY_FOLLOWERS["followers"] = [dict(f) for f in data.get("followers", [])]
         return
-    with open(FOLLOWERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    tmp_file = FOLLOWERS_FILE + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, FOLLOWERS_FILE)
+    except Exception:
+        # Callers mutate the cached dict in place before writing; never keep
+        # a state that did not make it to disk.
+        _CACHE = None
+        raise
+    _CACHE = data
+    _CACHE_MTIME = os.stat(FOLLOWERS_FILE).st_mtime_ns
 
 
 def _create_testnet_client(api_key, secret_key):
     client = Client(api_key, secret_key, testnet=True)
-    client.API_URL = "https://testnet.binance.vision/api"
-    client.FUTURES_URL = "https://testnet.binancefuture.com/fapi"
+    client.API_URL = TESTNET_API_URL
+    client.FUTURES_URL = TESTNET_FUTURES_URL
     return client
 
 
@@ -42,40 +97,62 @@ def ensure_followers_file():
             _write_followers_file({"followers": []})
 
 
+def _mask_key(key):
+    return (key[:6] + "..." + key[-4:]) if len(key) > 10 else "***"
+
+
 def add_follower(label, api_key, secret_key):
-    """Add follower and validate credentials by calling futures_account()."""
-    with LOCK:
-        # Validate first
-        test_client = _create_testnet_client(api_key, secret_key)
-        test_client.futures_account()
+    """Add follower and validate credentials by calling futures_account_balance()."""
+    # Validate first, outside LOCK: mirrored orders read the follower list under it
+    api_key = api_key.strip()
+    secret_key = secret_key.strip()
+    test_client = _create_testnet_client(api_key, secret_key)
+    try:
+        # Smallest signed futures endpoint; futures_account() returns every position
+        test_client.futures_account_balance(recvWindow=3000)
+    finally:
+        # The client only serves this check
+        test_client.close_connection()
 
+    with LOCK:
         data = _read_followers_file()
-        fid = f"f_{int(datetime.utcnow().timestamp() * 1000)}"
+        fid = f"f_{time.time_ns() // 1_000_000}"
+        if any(f["id"] == fid for f in data["followers"]):
+            # Two adds in the same millisecond; fall back to a random suffix
+            fid = f"f_{uuid.uuid4().hex[:12]}"
         follower = {
             "id": fid,
             "label": label.strip() if label else fid,
-            "api_key": api_key.strip(),
-            "secret_key": secret_key.strip(),
+            "api_key": api_key,
+            "api_key_masked": _mask_key(api_key),
+            "secret_key": secret_key,
             "active": True,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
         }
         data["followers"].append(follower)
         _write_followers_file(data)
+        _invalidate_active_followers()
         return follower
 
 
 def list_followers(mask_keys=True):
     with LOCK:
         data = _read_followers_file()
-        out = []
-        for f in data.get("followers", []):
-            item = dict(f)
-            if mask_keys:
-                key = item.get("api_key", "")
-                item["api_key"] = (key[:6] + "..." + key[-4:]) if len(key) > 10 else "***"
-                item.pop("secret_key", None)
-            out.append(item)
-        return out
+        followers = data.get("followers", [])
+        if not mask_keys:
+            return [dict(f) for f in followers]
+        # Project only the safe fields; the secret is never copied
+        return [
+            {
+                "id": f["id"],
+                "label": f.get("label", f["id"]),
+                "active": f.get("active", True),
+                "created_at": f.get("created_at"),
+                # Records saved before the masked field existed are masked on the fly
+                "api_key_masked": f.get("api_key_masked") or _mask_key(f.get("api_key", "")),
+            }
+            for f in followers
+        ]
 
 
 def toggle_follower(fid):
@@ -85,6 +162,9 @@ def toggle_follower(fid):
             if f["id"] == fid:
                 f["active"] = not f.get("active", True)
                 _write_followers_file(data)
+                _invalidate_active_followers()
+                if not f["active"]:
+                    _drop_signer(f)
                 return f
     raise ValueError("Follower not found")
 
@@ -92,18 +172,153 @@ def toggle_follower(fid):
 def delete_follower(fid):
     with LOCK:
         data = _read_followers_file()
-        before = len(data.get("followers", []))
-        data["followers"] = [f for f in data.get("followers", []) if f["id"] != fid]
-        if len(data["followers"]) == before:
+        removed = [f for f in data.get("followers", []) if f["id"] == fid]
+        if not removed:
             raise ValueError("Follower not found")
+        data["followers"] = [f for f in data.get("followers", []) if f["id"] != fid]
         _write_followers_file(data)
+        _invalidate_active_followers()
+        for f in removed:
+            _drop_signer(f)
         return True
 
 
+def _invalidate_active_followers():
+    global _ACTIVE_TS
+    _ACTIVE_TS = 0.0
+
+
 def _active_followers():
+    global _ACTIVE_LIST, _ACTIVE_TS
     with LOCK:
+        now = time.monotonic()
+        if now - _ACTIVE_TS < ACTIVE_CACHE_SECONDS:
+            return _ACTIVE_LIST
         data = _read_followers_file()
-        return [f for f in data.get("followers", []) if f.get("active", True)]
+        _ACTIVE_LIST = [f for f in data.get("followers", []) if f.get("active", True)]
+        _ACTIVE_TS = now
+        return _ACTIVE_LIST
+
+
+def _get_mirror_loop():
+    """Return the background event loop used for mirror fan-out, starting it on first use."""
+    global _MIRROR_LOOP
+    with _MIRROR_LOOP_LOCK:
+        if _MIRROR_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="mirror-loop", daemon=True).start()
+            _MIRROR_LOOP = loop
+        return _MIRROR_LOOP
+
+
+async def _get_mirror_session():
+    """Shared keep-alive session; must be created on the mirror loop."""
+    global _MIRROR_SESSION
+    if _MIRROR_SESSION is None or _MIRROR_SESSION.closed:
+        _MIRROR_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=MIRROR_TIMEOUT_SECONDS),
+        )
+    return _MIRROR_SESSION
+
+
+def _order_prefix(symbol, side, quantity, reduce_only):
+    """URL-encode the part of a mirrored order that is the same for every follower."""
+    params = {
+        "symbol": symbol,
+        "side": side,
+        "type": "MARKET",
+        "quantity": quantity,
+    }
+    if reduce_only:
+        params["reduceOnly"] = "true"
+    return urlencode(params)
+
+
+def _get_signer(f):
+    """Return a cached (keyed HMAC, headers) pair so each order only hashes its query."""
+    cache_key = (f["id"], f["secret_key"])
+    signer = _SIGNER_CACHE.get(cache_key)
+    if signer is None:
+        signer = (
+            hmac.new(f["secret_key"].encode(), digestmod=hashlib.sha256),
+            {
+                "X-MBX-APIKEY": f["api_key"],
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+        )
+        _SIGNER_CACHE[cache_key] = signer
+    return signer
+
+
+def _drop_signer(f):
+    _SIGNER_CACHE.pop((f["id"], f["secret_key"]), None)
+
+
+async def _place_mirror_async(session, f, prefix):
+    """Sign and POST one follower's mirrored market order, reporting the outcome."""
+    try:
+        base_mac, headers = _get_signer(f)
+        query = f"{prefix}&timestamp={time.time_ns() // 1_000_000}"
+        mac = base_mac.copy()
+        mac.update(query.encode())
+        signature = mac.hexdigest()
+
+        async with session.post(
+            f"{TESTNET_FUTURES_URL}/v1/order",
+            data=f"{query}&signature={signature}",
+            headers=headers,
+        ) as resp:
+            order = await resp.json(content_type=None)
+
+        if resp.status >= 400 or not isinstance(order, dict) or "orderId" not in order:
+            code = order.get("code") if isinstance(order, dict) else resp.status
+            msg = order.get("msg") if isinstance(order, dict) else order
+            raise RuntimeError(f"APIError(code={code}): {msg}")
+        return {"id": f["id"], "ok": True, "orderId": order.get("orderId")}
+    except Exception as e:
+        return {"id": f["id"], "ok": False, "error": (str(e) or type(e).__name__)[:200]}
+
+
+async def _mirror_to_followers_async(followers, symbol, side, quantity, reduce_only):
+    """Send the mirrored order to every given follower concurrently."""
+    if not followers:
+        return []
+    session = await _get_mirror_session()
+    prefix = _order_prefix(symbol, side, quantity, reduce_only)
+    return list(await asyncio.gather(*[
+        _place_mirror_async(session, f, prefix)
+        for f in followers
+    ]))
+
+
+async def copy_open_to_followers_async(followers, symbol, side, quantity):
+    """Async variant of copy_open_to_followers; must run on the mirror loop.
+
+    followers comes from _active_followers(), resolved before switching to the
+    loop so its file read and LOCK never block other mirrors.
+    """
+    return await _mirror_to_followers_async(followers, symbol, side, quantity, reduce_only=False)
+
+
+async def copy_close_to_followers_async(followers, symbol, side, quantity):
+    """Async variant of copy_close_to_followers; must run on the mirror loop."""
+    return await _mirror_to_followers_async(followers, symbol, side, quantity, reduce_only=True)
+
+
+@atexit.register
+def _close_mirror_session():
+    if _MIRROR_LOOP is None or _MIRROR_SESSION is None or _MIRROR_SESSION.closed:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_MIRROR_SESSION.close(), _MIRROR_LOOP).result(timeout=2)
+    except Exception:
+        pass
+
+
+def _run_on_mirror_loop(coro):
+    future = asyncio.run_coroutine_threadsafe(coro, _get_mirror_loop())
+    return future.result(timeout=MIRROR_TIMEOUT_SECONDS + 5)
 
 
 def copy_open_to_followers(symbol, side, quantity):
@@ -113,23 +328,10 @@ def copy_open_to_followers(symbol, side, quantity):
     side: 'BUY' (long entry) or 'SELL' (short entry)
     quantity: same quantity as master
     """
-    results = []
     followers = _active_followers()
-
-    for f in followers:
-        try:
-            c = _create_testnet_client(f["api_key"], f["secret_key"])
-            order = c.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type="MARKET",
-                quantity=quantity
-            )
-            results.append({"id": f["id"], "ok": True, "orderId": order.get("orderId")})
-        except Exception as e:
-            results.append({"id": f["id"], "ok": False, "error": str(e)[:200]})
-
-    return results
+    if not followers:
+        return []
+    return _run_on_mirror_loop(copy_open_to_followers_async(followers, symbol, side, quantity))
 
 
 def copy_close_to_followers(symbol, side, quantity):
@@ -139,21 +341,7 @@ def copy_close_to_followers(symbol, side, quantity):
     side: for closing long use SELL, for closing short use BUY
     quantity: same quantity as master position
     """
-    results = []
     followers = _active_followers()
-
-    for f in followers:
-        try:
-            c = _create_testnet_client(f["api_key"], f["secret_key"])
-            order = c.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type="MARKET",
-                quantity=quantity,
-                reduceOnly=True
-            )
-            results.append({"id": f["id"], "ok": True, "orderId": order.get("orderId")})
-        except Exception as e:
-            results.append({"id": f["id"], "ok": False, "error": str(e)[:200]})
-
-    return results
+    if not followers:
+        return []
+    return _run_on_mirror_loop(copy_close_to_followers_async(followers, symbol, side, quantity))
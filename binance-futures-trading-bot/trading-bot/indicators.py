@@ -10,9 +10,79 @@ import numpy as np
 import ta
 from datetime import datetime, timedelta,timezone
 import logging
+from binance.client import Client
+
+from constants import TREND_BEAR, TREND_BULL, TREND_NEUTRAL
+from indicators_nb import (
+    NUMBA_AVAILABLE, adx_nb, atr_nb, bollinger_nb, ewm_span_nb, macd_nb, rolling_mean_nb, rsi_nb, stoch_nb,
+)
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Columns of a kline frame, indexed by open time in ms
+CANDLE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# Timeframe -> Binance kline interval
+INTERVAL_MAP = {
+    '1m': Client.KLINE_INTERVAL_1MINUTE,
+    '5m': Client.KLINE_INTERVAL_5MINUTE,
+    '15m': Client.KLINE_INTERVAL_15MINUTE,
+    '30m': Client.KLINE_INTERVAL_30MINUTE,
+    '1h': Client.KLINE_INTERVAL_1HOUR,
+    '2h': Client.KLINE_INTERVAL_2HOUR,
+    '4h': Client.KLINE_INTERVAL_4HOUR,
+}
+
+
+def ema(series, span):
+    """series.ewm(span=span, adjust=False).mean(), via the numba kernel or scipy's lfilter when installed"""
+    if NUMBA_AVAILABLE:
+        return pd.Series(ewm_span_nb(series.to_numpy(dtype=np.float64), span), index=series.index)
+    if SCIPY_AVAILABLE and len(series):
+        values = series.to_numpy(dtype=np.float64)
+        # lfilter carries a NaN forward forever while pandas skips it, so only clean input goes this way
+        if not np.isnan(values).any():
+            return pd.Series(ewm_lfilter(values, span), index=series.index)
+    return series.ewm(span=span, adjust=False).mean()
+
+
+def ewm_lfilter(values, span):
+    """Same recurrence as ewm(span=span, adjust=False) run through scipy's C IIR filter (equal to ~1e-16)"""
+    alpha = 2 / (span + 1)
+    # y[0] is x[0] exactly, like pandas; the filter state carries it into y[1:]
+    out = np.empty_like(values)
+    out[0] = values[0]
+    out[1:], _ = lfilter([alpha], [1, -(1 - alpha)], values[1:], zi=[values[0] * (1 - alpha)])
+    return out
+
+
+def rolling_max(series, window):
+    """series.rolling(window).max(), via bottleneck's O(n) sliding window when installed"""
+    # bottleneck rejects a window longer than the series; pandas gives all NaN
+    if BOTTLENECK_AVAILABLE and window <= len(series):
+        return pd.Series(bn.move_max(series.to_numpy(dtype=np.float64), window, min_count=window), index=series.index)
+    return series.rolling(window=window).max()
+
+
+def rolling_min(series, window):
+    """series.rolling(window).min(), via bottleneck's O(n) sliding window when installed"""
+    if BOTTLENECK_AVAILABLE and window <= len(series):
+        return pd.Series(bn.move_min(series.to_numpy(dtype=np.float64), window, min_count=window), index=series.index)
+    return series.rolling(window=window).min()
+
+
 class IndicatorCalculator:
     """Calculate indicators for a specific coin"""
     
@@ -20,22 +90,67 @@ class IndicatorCalculator:
         self.coin = coin
         self.params = params['parameters']  # Extract parameters section
         self.last_calculation = None
+        # Last indicator frame per timeframe, keyed on the candles it was built from
+        self._df_cache = {}
+        self._refresh_params()
+    
+    def _refresh_params(self):
+        """Unpack scorer weights and thresholds into attributes; call again if self.params changes"""
+        p = self.params
+        
+        # Filter weights; a filter takes part only when its weight is above 0.01
+        self._w_rsi = p.get('rsi_weight', 0)
+        self._w_trend_ema = p.get('trend_ema_weight', 0)
+        self._w_price_ema = p.get('price_ema_weight', 0)
+        self._w_macd = p.get('macd_weight', 0)
+        self._w_volume_spike = p.get('volume_spike_weight', 0)
+        self._w_bollinger = p.get('bollinger_weight', 0)
+        self._w_stochastic = p.get('stochastic_weight', 0)
+        self._w_atr = p.get('atr_weight', 0)
+        self._w_adx = p.get('adx_weight', 0)
+        self._w_sr = p.get('sr_weight', 0)
+        self._w_momentum = p.get('momentum_weight', 0)
+        self._w_market_structure = p.get('market_structure_weight', 0)
+        self._w_time_filter = p.get('time_filter_weight', 0)
+        self._w_mtf = p.get('mtf_confirmation_weight', 0)
+        
+        self._rsi_active = self._w_rsi > 0.01
+        self._trend_ema_active = self._w_trend_ema > 0.01
+        self._price_ema_active = self._w_price_ema > 0.01
+        self._macd_active = self._w_macd > 0.01
+        self._volume_spike_active = self._w_volume_spike > 0.01
+        self._bollinger_active = self._w_bollinger > 0.01
+        self._stochastic_active = self._w_stochastic > 0.01
+        self._atr_active = self._w_atr > 0.01
+        self._adx_active = self._w_adx > 0.01
+        self._sr_active = self._w_sr > 0.01
+        self._momentum_active = self._w_momentum > 0.01
+        self._market_structure_active = self._w_market_structure > 0.01
+        self._time_filter_active = self._w_time_filter > 0.01
+        self._mtf_active = self._w_mtf > 0.01
+        
+        # Thresholds, only read by filters that are active
+        self._rsi_oversold = p.get('rsi_oversold')
+        self._rsi_overbought = p.get('rsi_overbought')
+        self._macd_flip_only = p.get('macd_flip_only', 0) > 0.5
+        self._macd_threshold = p.get('macd_histogram_threshold', 0)
+        self._bollinger_squeeze = p.get('bollinger_squeeze_enabled', 0) > 0.5
+        self._stoch_oversold = p.get('stochastic_oversold')
+        self._stoch_overbought = p.get('stochastic_overbought')
+        self._atr_min = p.get('atr_min_threshold')
+        self._adx_threshold = p.get('adx_threshold')
+        self._momentum_threshold = p.get('momentum_threshold')
+        self._start_hour = int(p['trade_start_hour']) if self._time_filter_active else None
+        self._end_hour = int(p['trade_end_hour']) if self._time_filter_active else None
+        self._entry_threshold = p.get('entry_threshold')
+        
+        self._build_indicator_pipeline()
         
     def fetch_historical_data(self, client, timeframe, limit=200):
         """Fetch historical candles from Binance"""
         try:
             # Convert timeframe to Binance format
-            interval_map = {
-                '1m': client.KLINE_INTERVAL_1MINUTE,
-                '5m': client.KLINE_INTERVAL_5MINUTE,
-                '15m': client.KLINE_INTERVAL_15MINUTE,
-                '30m': client.KLINE_INTERVAL_30MINUTE,
-                '1h': client.KLINE_INTERVAL_1HOUR,
-                '2h': client.KLINE_INTERVAL_2HOUR,
-                '4h': client.KLINE_INTERVAL_4HOUR,
-            }
-            
-            interval = interval_map.get(timeframe, timeframe)
+            interval = INTERVAL_MAP.get(timeframe, timeframe)
             
             # Fetch klines
             klines = client.futures_klines(
@@ -44,21 +159,17 @@ class IndicatorCalculator:
                 limit=limit
             )
             
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_vol',
-                'taker_buy_quote_vol', 'ignore'
-            ])
+            # Convert the list of string klines straight to arrays, keeping only OHLCV
+            if not klines:
+                return pd.DataFrame(columns=CANDLE_COLUMNS, dtype=float)
+            arr = np.asarray(klines, dtype=object)
             
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-            
-            df.set_index('timestamp', inplace=True)
-            
-            return df[['open', 'high', 'low', 'close', 'volume']]
+            # Index stays as the raw int64 open time in ms; nothing downstream needs datetimes
+            return pd.DataFrame(
+                arr[:, 1:6].astype(np.float64),
+                columns=CANDLE_COLUMNS,
+                index=pd.Index(arr[:, 0].astype(np.int64), name='timestamp')
+            )
             
         except Exception as e:
             logger.error(f"Error fetching data for {self.coin} {timeframe}: {e}")
@@ -67,374 +178,407 @@ class IndicatorCalculator:
                 raise
             return None
     
-    def calculate_all_indicators(self, df):
-        """Calculate all indicators based on parameters - YOUR EXACT STRATEGY"""
-        
-        # Get exact parameters as integers where needed
-        rsi_period = int(round(self.params['rsi_period']))
-        trend_fast_ema = int(round(self.params['trend_fast_ema']))
-        trend_slow_ema = int(round(self.params['trend_slow_ema']))
-        entry_ema_period = int(round(self.params['entry_ema_period']))
-        macd_fast = int(round(self.params['macd_fast']))
-        macd_slow = int(round(self.params['macd_slow']))
-        macd_signal = int(round(self.params['macd_signal']))
-        volume_ma_period = int(round(self.params['volume_ma_period']))
-        bollinger_period = int(round(self.params['bollinger_period']))
-        bollinger_squeeze_length = int(round(self.params['bollinger_squeeze_length']))
-        stochastic_k = int(round(self.params['stochastic_k']))
-        stochastic_d = int(round(self.params['stochastic_d']))
-        atr_period = int(round(self.params['atr_period']))
-        adx_period = int(round(self.params['adx_period']))
-        sr_lookback = int(round(self.params['sr_lookback']))
-        momentum_period = int(round(self.params['momentum_period']))
-        structure_lookback = int(round(self.params['structure_lookback']))
-        
-        # RSI - if weight > 0.01
-        if self.params.get('rsi_weight', 0) > 0.01:
-            df['rsi'] = ta.momentum.RSIIndicator(close=df['close'], window=rsi_period).rsi()
-        
-        # EMAs for trend - if weight > 0.01
-        if self.params.get('trend_ema_weight', 0) > 0.01:
-            df['ema_fast'] = df['close'].ewm(span=trend_fast_ema, adjust=False).mean()
-            df['ema_slow'] = df['close'].ewm(span=trend_slow_ema, adjust=False).mean()
-            df['trend'] = np.where(df['ema_fast'] > df['ema_slow'], 'BULLISH', 'BEARISH')
-        
-        # Entry EMA - if weight > 0.01
-        if self.params.get('price_ema_weight', 0) > 0.01:
-            df['entry_ema'] = df['close'].ewm(span=entry_ema_period, adjust=False).mean()
-        
-        # MACD - if weight > 0.01
-        if self.params.get('macd_weight', 0) > 0.01:
-            macd = ta.trend.MACD(df['close'], window_slow=macd_slow, window_fast=macd_fast, window_sign=macd_signal)
-            df['macd_histogram'] = macd.macd_diff()
-            df['macd_histogram_prev'] = df['macd_histogram'].shift(1)
-            df['macd_flip_bullish'] = (df['macd_histogram_prev'] < 0) & (df['macd_histogram'] > 0)
-            df['macd_flip_bearish'] = (df['macd_histogram_prev'] > 0) & (df['macd_histogram'] < 0)
-        
-        # Volume - if weight > 0.01
-        if self.params.get('volume_spike_weight', 0) > 0.01:
-            df['vol_ma'] = df['volume'].rolling(window=volume_ma_period).mean()
-            df['vol_spike'] = df['volume'] > (df['vol_ma'] * self.params['volume_spike_multiplier'])
-        
-        # Bollinger Bands - if weight > 0.01
-        if self.params.get('bollinger_weight', 0) > 0.01:
+    def calculate_all_indicators(self, df, timeframe=None):
+        """
+        Calculate all indicators based on parameters - YOUR EXACT STRATEGY
+        With a timeframe, the result is cached and returned as-is while the
+        candles are unchanged (e.g. the trend frame between its own closes);
+        treat it as read-only.
+        """
+        if timeframe is not None and len(df) > 0:
+            last = df.iloc[-1]
+            source_key = (len(df), df.index[0], df.index[-1], last['close'], last['volume'])
+            cached = self._df_cache.get(timeframe)
+            if cached is not None and cached[0] == source_key:
+                return cached[1]
+            df = self._calculate_all_indicators(df)
+            self._df_cache[timeframe] = (source_key, df)
+            return df
+        return self._calculate_all_indicators(df)
+    
+    def _calculate_all_indicators(self, df):
+        # Steps read OHLCV from df and collect their columns in out, which is
+        # joined onto df once instead of inserting each column separately
+        out = {}
+        for calc in self._indicator_pipeline:
+            calc(df, out)
+        if not out:
+            return df
+        stale = df.columns.intersection(list(out))
+        if len(stale):
+            df = df.drop(columns=stale)
+        return pd.concat([df, pd.DataFrame(out, index=df.index)], axis=1)
+    
+    def _build_indicator_pipeline(self):
+        """Pick the indicator steps for filters with weight > 0.01 and cache their periods"""
+        p = self.params
+        
+        def period(key):
+            # Get exact parameters as integers where needed
+            return int(round(p[key]))
+        
+        pipeline = []
+        if self._rsi_active:
+            self._rsi_period = period('rsi_period')
+            pipeline.append(self._calc_rsi)
+        if self._trend_ema_active:
+            self._trend_fast_ema = period('trend_fast_ema')
+            self._trend_slow_ema = period('trend_slow_ema')
+            pipeline.append(self._calc_trend_ema)
+        if self._price_ema_active:
+            self._entry_ema_period = period('entry_ema_period')
+            pipeline.append(self._calc_entry_ema)
+        if self._macd_active:
+            self._macd_fast = period('macd_fast')
+            self._macd_slow = period('macd_slow')
+            self._macd_signal = period('macd_signal')
+            pipeline.append(self._calc_macd)
+        if self._volume_spike_active:
+            self._volume_ma_period = period('volume_ma_period')
+            self._volume_spike_multiplier = p['volume_spike_multiplier']
+            pipeline.append(self._calc_volume_spike)
+        if self._bollinger_active:
+            self._bollinger_period = period('bollinger_period')
+            self._bollinger_std = p['bollinger_std']
+            if self._bollinger_squeeze:
+                self._bollinger_squeeze_length = period('bollinger_squeeze_length')
+            pipeline.append(self._calc_bollinger)
+        if self._stochastic_active:
+            self._stochastic_k = period('stochastic_k')
+            self._stochastic_d = period('stochastic_d')
+            pipeline.append(self._calc_stochastic)
+        if self._atr_active:
+            self._atr_period = period('atr_period')
+            pipeline.append(self._calc_atr)
+        if self._adx_active:
+            self._adx_period = period('adx_period')
+            pipeline.append(self._calc_adx)
+        if self._sr_active:
+            self._sr_lookback = period('sr_lookback')
+            self._sr_touch_distance = p['sr_touch_distance']
+            pipeline.append(self._calc_support_resistance)
+        if self._momentum_active:
+            self._momentum_period = period('momentum_period')
+            pipeline.append(self._calc_momentum)
+        if self._market_structure_active:
+            self._structure_lookback = period('structure_lookback')
+            pipeline.append(self._calc_market_structure)
+        self._indicator_pipeline = pipeline
+    
+    def _calc_rsi(self, df, out):
+        if NUMBA_AVAILABLE:
+            out['rsi'] = rsi_nb(df['close'].to_numpy(dtype=np.float64), self._rsi_period)
+        else:
+            out['rsi'] = ta.momentum.RSIIndicator(close=df['close'], window=self._rsi_period).rsi()
+    
+    def _calc_trend_ema(self, df, out):
+        out['ema_fast'] = ema(df['close'], self._trend_fast_ema)
+        out['ema_slow'] = ema(df['close'], self._trend_slow_ema)
+        # TREND_BULL / TREND_BEAR, stored as int8 so filters compare numbers, not strings
+        out['trend'] = np.where(out['ema_fast'] > out['ema_slow'], TREND_BULL, TREND_BEAR).astype(np.int8)
+    
+    def _calc_entry_ema(self, df, out):
+        out['entry_ema'] = ema(df['close'], self._entry_ema_period)
+    
+    def _calc_macd(self, df, out):
+        if NUMBA_AVAILABLE:
+            out['macd_histogram'] = macd_nb(
+                df['close'].to_numpy(dtype=np.float64), self._macd_fast, self._macd_slow, self._macd_signal
+            )
+        else:
+            macd = ta.trend.MACD(
+                df['close'], window_slow=self._macd_slow, window_fast=self._macd_fast, window_sign=self._macd_signal
+            )
+            out['macd_histogram'] = macd.macd_diff()
+        # Strict sign change against the previous candle; zeros and NaNs never flip
+        hist = np.asarray(out['macd_histogram'], dtype=np.float64)
+        prev, cur = hist[:-1], hist[1:]
+        flip_bullish = np.zeros(hist.shape[0], dtype=bool)
+        flip_bearish = np.zeros(hist.shape[0], dtype=bool)
+        flip_bullish[1:] = (prev < 0) & (cur > 0)
+        flip_bearish[1:] = (prev > 0) & (cur < 0)
+        out['macd_flip_bullish'] = flip_bullish
+        out['macd_flip_bearish'] = flip_bearish
+    
+    def _calc_volume_spike(self, df, out):
+        if NUMBA_AVAILABLE:
+            out['vol_ma'] = pd.Series(
+                rolling_mean_nb(df['volume'].to_numpy(dtype=np.float64), self._volume_ma_period), index=df.index
+            )
+        else:
+            out['vol_ma'] = df['volume'].rolling(window=self._volume_ma_period).mean()
+        out['vol_spike'] = df['volume'] > (out['vol_ma'] * self._volume_spike_multiplier)
+    
+    def _calc_bollinger(self, df, out):
+        if NUMBA_AVAILABLE:
+            upper, lower, width = bollinger_nb(
+                df['close'].to_numpy(dtype=np.float64), self._bollinger_period, float(self._bollinger_std)
+            )
+            out['bb_upper'] = upper
+            out['bb_lower'] = lower
+            out['bb_width'] = pd.Series(width, index=df.index)
+        else:
             bb = ta.volatility.BollingerBands(
                 close=df['close'], 
-                window=bollinger_period, 
-                window_dev=self.params['bollinger_std']
+                window=self._bollinger_period, 
+                window_dev=self._bollinger_std
             )
-            df['bb_upper'] = bb.bollinger_hband()
-            df['bb_lower'] = bb.bollinger_lband()
-            df['bb_width'] = bb.bollinger_wband()
-            
-            if self.params.get('bollinger_squeeze_enabled', 0) > 0.5:
-                df['bb_squeeze'] = df['bb_width'] == df['bb_width'].rolling(window=bollinger_squeeze_length).min()
+            out['bb_upper'] = bb.bollinger_hband()
+            out['bb_lower'] = bb.bollinger_lband()
+            out['bb_width'] = bb.bollinger_wband()
         
-        # Stochastic - if weight > 0.01
-        if self.params.get('stochastic_weight', 0) > 0.01:
+        if self._bollinger_squeeze:
+            out['bb_squeeze'] = out['bb_width'] == rolling_min(out['bb_width'], self._bollinger_squeeze_length)
+    
+    def _calc_stochastic(self, df, out):
+        if NUMBA_AVAILABLE:
+            # Only %K is used; stochastic_d smooths the unused %D line
+            out['stoch_k'] = stoch_nb(
+                df['high'].to_numpy(dtype=np.float64), df['low'].to_numpy(dtype=np.float64),
+                df['close'].to_numpy(dtype=np.float64), self._stochastic_k
+            )
+        else:
             stoch = ta.momentum.StochasticOscillator(
                 high=df['high'], low=df['low'], close=df['close'],
-                window=stochastic_k, smooth_window=stochastic_d
+                window=self._stochastic_k, smooth_window=self._stochastic_d
             )
-            df['stoch_k'] = stoch.stoch()
-        
-        # ATR - if weight > 0.01
-        if self.params.get('atr_weight', 0) > 0.01:
-            df['atr'] = ta.volatility.AverageTrueRange(
-                high=df['high'], low=df['low'], close=df['close'], window=atr_period
+            out['stoch_k'] = stoch.stoch()
+    
+    def _calc_atr(self, df, out):
+        if NUMBA_AVAILABLE:
+            out['atr'] = atr_nb(
+                df['high'].to_numpy(dtype=np.float64), df['low'].to_numpy(dtype=np.float64),
+                df['close'].to_numpy(dtype=np.float64), self._atr_period
+            )
+        else:
+            out['atr'] = ta.volatility.AverageTrueRange(
+                high=df['high'], low=df['low'], close=df['close'], window=self._atr_period
             ).average_true_range()
-        
-        # ADX - if weight > 0.01
-        if self.params.get('adx_weight', 0) > 0.01:
-            adx = ta.trend.ADXIndicator(high=df['high'], low=df['low'], close=df['close'], window=adx_period)
-            df['adx'] = adx.adx()
-        
-        # Support/Resistance - if weight > 0.01
-        if self.params.get('sr_weight', 0) > 0.01:
-            df['resistance'] = df['high'].rolling(window=sr_lookback).max()
-            df['support'] = df['low'].rolling(window=sr_lookback).min()
-            df['near_resistance'] = abs(df['close'] - df['resistance']) / df['close'] < self.params['sr_touch_distance']
-            df['near_support'] = abs(df['close'] - df['support']) / df['close'] < self.params['sr_touch_distance']
-        
-        # Momentum - if weight > 0.01
-        if self.params.get('momentum_weight', 0) > 0.01:
-            df['momentum'] = df['close'].pct_change(periods=momentum_period)
-        
-        # Market Structure - if weight > 0.01
-        if self.params.get('market_structure_weight', 0) > 0.01:
-            df['highest_high'] = df['high'].rolling(window=structure_lookback).max()
-            df['lowest_low'] = df['low'].rolling(window=structure_lookback).min()
-            df['highest_high_prev'] = df['highest_high'].shift(structure_lookback)
-            df['lowest_low_prev'] = df['lowest_low'].shift(structure_lookback)
-            df['market_structure'] = np.where(
-                (df['highest_high'] > df['highest_high_prev']) & (df['lowest_low'] > df['lowest_low_prev']), 
-                'BULLISH',
-                np.where(
-                    (df['highest_high'] < df['highest_high_prev']) & (df['lowest_low'] < df['lowest_low_prev']), 
-                    'BEARISH', 
-                    'NEUTRAL'
-                )
+    
+    def _calc_adx(self, df, out):
+        if NUMBA_AVAILABLE:
+            out['adx'] = adx_nb(
+                df['high'].to_numpy(dtype=np.float64), df['low'].to_numpy(dtype=np.float64),
+                df['close'].to_numpy(dtype=np.float64), self._adx_period
             )
-        
-        return df
+        else:
+            adx = ta.trend.ADXIndicator(high=df['high'], low=df['low'], close=df['close'], window=self._adx_period)
+            out['adx'] = adx.adx()
     
-    def calculate_weighted_signal(self, row, trend_data=None):
-        """Calculate weighted signal from all filters - YOUR EXACT FORMULA"""
-        weighted_sum = 0.0
+    def _calc_support_resistance(self, df, out):
+        out['resistance'] = rolling_max(df['high'], self._sr_lookback)
+        out['support'] = rolling_min(df['low'], self._sr_lookback)
+        # |close - level| / close < d, multiplied out over raw arrays (close is always > 0)
+        close = df['close'].to_numpy(dtype=np.float64)
+        touch = close * self._sr_touch_distance
+        out['near_resistance'] = np.abs(close - out['resistance'].to_numpy()) < touch
+        out['near_support'] = np.abs(close - out['support'].to_numpy()) < touch
+    
+    def _calc_momentum(self, df, out):
+        out['momentum'] = df['close'].pct_change(periods=self._momentum_period)
+    
+    def _calc_market_structure(self, df, out):
+        out['highest_high'] = rolling_max(df['high'], self._structure_lookback)
+        out['lowest_low'] = rolling_min(df['low'], self._structure_lookback)
+        highest_high_prev = out['highest_high'].shift(self._structure_lookback)
+        lowest_low_prev = out['lowest_low'].shift(self._structure_lookback)
+        # TREND_BULL / TREND_BEAR / TREND_NEUTRAL
+        out['market_structure'] = np.select(
+            [
+                (out['highest_high'] > highest_high_prev) & (out['lowest_low'] > lowest_low_prev),
+                (out['highest_high'] < highest_high_prev) & (out['lowest_low'] < lowest_low_prev),
+            ],
+            [TREND_BULL, TREND_BEAR],
+            default=TREND_NEUTRAL
+        ).astype(np.int8)
+    
+    def time_filter_signal(self):
+        """Time filter signal for the current UTC hour: 0.1 inside the trading window, -0.5 outside"""
+        hour = datetime.now(timezone.utc).hour
+        start_hour = self._start_hour
+        end_hour = self._end_hour
+        
+        if start_hour <= end_hour:
+            in_window = start_hour <= hour <= end_hour
+        else:  # Overnight trading
+            in_window = hour >= start_hour or hour <= end_hour
+        
+        return 0.1 if in_window else -0.5
+    
+    def calculate_weighted_signal_vec(self, df, trend_data=None):
+        """
+        Vectorized weighted signal over every row of df - YOUR EXACT FORMULA
+        Returns (weighted_sum, filter_signals) with one value per row; filter
+        signals are {'name': {'weight': w, 'signal': ndarray}}.
+        trend_data['trend'] may be a single higher-timeframe code or an
+        array aligned with df.
+        """
+        n = len(df)
+        weighted_sum = np.zeros(n)
         filter_signals = {}
+        columns = df.columns
+        
+        def values(column):
+            return df[column].to_numpy(dtype=np.float64)
+        
+        def flags(column):
+            return df[column].to_numpy(dtype=bool)
+        
+        def add(name, weight, signal):
+            signal = np.broadcast_to(np.asarray(signal, dtype=np.float64), (n,))
+            np.add(weighted_sum, weight * signal, out=weighted_sum)
+            filter_signals[name] = {'weight': weight, 'signal': signal}
+        
+        close = values('close')
+        trend = df['trend'].to_numpy(dtype=np.int8) if 'trend' in columns else np.zeros(n, dtype=np.int8)
+        trend_signal = trend.astype(np.float64)
         
         # RSI
-        if self.params.get('rsi_weight', 0) > 0.01 and 'rsi' in row:
-            rsi = row['rsi']
-            oversold = self.params['rsi_oversold']
-            overbought = self.params['rsi_overbought']
-            
-            if rsi < oversold:
-                signal = 1.0  # Strong LONG
-            elif rsi < oversold + 10:
-                signal = 0.5  # Weak LONG
-            elif rsi > overbought:
-                signal = -1.0  # Strong SHORT
-            elif rsi > overbought - 10:
-                signal = -0.5  # Weak SHORT
-            else:
-                signal = 0.0  # Neutral
-            
-            weight = self.params['rsi_weight']
-            weighted_sum += weight * signal
-            filter_signals['rsi'] = {'weight': weight, 'signal': signal}
+        if self._rsi_active and 'rsi' in columns:
+            rsi = values('rsi')
+            oversold = self._rsi_oversold
+            overbought = self._rsi_overbought
+            add('rsi', self._w_rsi, np.select(
+                [rsi < oversold, rsi < oversold + 10, rsi > overbought, rsi > overbought - 10],
+                [1.0, 0.5, -1.0, -0.5],  # Strong/Weak LONG, Strong/Weak SHORT
+                0.0
+            ))
         
         # Trend EMA
-        if self.params.get('trend_ema_weight', 0) > 0.01 and 'trend' in row:
-            trend = row['trend']
-            signal = 1.0 if trend == 'BULLISH' else -1.0 if trend == 'BEARISH' else 0.0
-            weight = self.params['trend_ema_weight']
-            weighted_sum += weight * signal
-            filter_signals['trend_ema'] = {'weight': weight, 'signal': signal}
+        if self._trend_ema_active and 'trend' in columns:
+            add('trend_ema', self._w_trend_ema, trend_signal)
         
         # Price EMA
-        if self.params.get('price_ema_weight', 0) > 0.01 and 'entry_ema' in row:
-            price = row['close']
-            ema = row['entry_ema']
-            distance = (price - ema) / ema
-            
-            if distance < -0.002:
-                signal = 0.8
-            elif distance < 0:
-                signal = 0.3
-            elif distance > 0.002:
-                signal = -0.8
-            elif distance > 0:
-                signal = -0.3
-            else:
-                signal = 0.0
-            
-            weight = self.params['price_ema_weight']
-            weighted_sum += weight * signal
-            filter_signals['price_ema'] = {'weight': weight, 'signal': signal}
+        if self._price_ema_active and 'entry_ema' in columns:
+            ema = values('entry_ema')
+            distance = (close - ema) / ema
+            add('price_ema', self._w_price_ema, np.select(
+                [distance < -0.002, distance < 0, distance > 0.002, distance > 0],
+                [0.8, 0.3, -0.8, -0.3],
+                0.0
+            ))
         
         # MACD
-        if self.params.get('macd_weight', 0) > 0.01:
-            if self.params.get('macd_flip_only', 0) > 0.5:
-                if 'macd_flip_bullish' in row and row['macd_flip_bullish']:
-                    signal = 1.0
-                elif 'macd_flip_bearish' in row and row['macd_flip_bearish']:
-                    signal = -1.0
-                else:
-                    signal = 0.0
+        if self._macd_active:
+            if self._macd_flip_only:
+                bullish = flags('macd_flip_bullish') if 'macd_flip_bullish' in columns else np.zeros(n, dtype=bool)
+                bearish = flags('macd_flip_bearish') if 'macd_flip_bearish' in columns else np.zeros(n, dtype=bool)
+                signal = np.select([bullish, bearish], [1.0, -1.0], 0.0)
+            elif 'macd_histogram' in columns:
+                macd_hist = values('macd_histogram')
+                threshold = self._macd_threshold
+                signal = np.select(
+                    [macd_hist > threshold, macd_hist < -threshold],
+                    [np.minimum(macd_hist / 0.002, 1.0), np.maximum(macd_hist / 0.002, -1.0)],
+                    0.0
+                )
             else:
-                if 'macd_histogram' in row:
-                    macd_hist = row['macd_histogram']
-                    threshold = self.params.get('macd_histogram_threshold', 0)
-                    if macd_hist > threshold:
-                        signal = min(macd_hist / 0.002, 1.0)
-                    elif macd_hist < -threshold:
-                        signal = max(macd_hist / 0.002, -1.0)
-                    else:
-                        signal = 0.0
-                else:
-                    signal = 0.0
-            
-            weight = self.params['macd_weight']
-            weighted_sum += weight * signal
-            filter_signals['macd'] = {'weight': weight, 'signal': signal}
+                signal = 0.0
+            add('macd', self._w_macd, signal)
         
         # Volume Spike
-        if self.params.get('volume_spike_weight', 0) > 0.01 and 'vol_spike' in row:
-            if row['vol_spike']:
-                price_change = (row['close'] - row['open']) / row['open']
-                signal = 0.5 if price_change > 0 else -0.5
-            else:
-                signal = 0.0
-            
-            weight = self.params['volume_spike_weight']
-            weighted_sum += weight * signal
-            filter_signals['volume_spike'] = {'weight': weight, 'signal': signal}
+        if self._volume_spike_active and 'vol_spike' in columns:
+            price_change = (close - values('open')) / values('open')
+            add('volume_spike', self._w_volume_spike,
+                np.where(flags('vol_spike'), np.where(price_change > 0, 0.5, -0.5), 0.0))
         
         # Bollinger Bands
-        if self.params.get('bollinger_weight', 0) > 0.01:
-            price = row['close']
-            if 'bb_lower' in row and 'bb_upper' in row:
-                bb_lower = row['bb_lower']
-                bb_upper = row['bb_upper']
-                
-                if self.params.get('bollinger_squeeze_enabled', 0) > 0.5:
-                    squeeze = row.get('bb_squeeze', False)
-                    if squeeze:
-                        if price <= bb_lower:
-                            signal = 1.0
-                        elif price >= bb_upper:
-                            signal = -1.0
-                        else:
-                            signal = 0.0
-                    else:
-                        signal = 0.0
+        if self._bollinger_active:
+            if 'bb_lower' in columns and 'bb_upper' in columns:
+                at_lower = close <= values('bb_lower')
+                at_upper = close >= values('bb_upper')
+                if self._bollinger_squeeze:
+                    squeeze = flags('bb_squeeze') if 'bb_squeeze' in columns else np.zeros(n, dtype=bool)
+                    signal = np.select([squeeze & at_lower, squeeze & at_upper], [1.0, -1.0], 0.0)
                 else:
-                    if price <= bb_lower:
-                        signal = 0.8
-                    elif price >= bb_upper:
-                        signal = -0.8
-                    else:
-                        signal = 0.0
+                    signal = np.select([at_lower, at_upper], [0.8, -0.8], 0.0)
             else:
                 signal = 0.0
-            
-            weight = self.params['bollinger_weight']
-            weighted_sum += weight * signal
-            filter_signals['bollinger'] = {'weight': weight, 'signal': signal}
+            add('bollinger', self._w_bollinger, signal)
         
         # Stochastic
-        if self.params.get('stochastic_weight', 0) > 0.01 and 'stoch_k' in row:
-            stoch_k = row['stoch_k']
-            oversold = self.params['stochastic_oversold']
-            overbought = self.params['stochastic_overbought']
-            
-            if stoch_k < oversold:
-                signal = 1.0
-            elif stoch_k > overbought:
-                signal = -1.0
-            else:
-                signal = 0.0
-            
-            weight = self.params['stochastic_weight']
-            weighted_sum += weight * signal
-            filter_signals['stochastic'] = {'weight': weight, 'signal': signal}
+        if self._stochastic_active and 'stoch_k' in columns:
+            stoch_k = values('stoch_k')
+            add('stochastic', self._w_stochastic, np.select(
+                [stoch_k < self._stoch_oversold, stoch_k > self._stoch_overbought],
+                [1.0, -1.0],
+                0.0
+            ))
         
         # ATR (volatility filter)
-        if self.params.get('atr_weight', 0) > 0.01 and 'atr' in row:
-            atr = row['atr']
-            min_atr = self.params['atr_min_threshold']
-            signal = 0.2 if atr > min_atr else -0.2
-            
-            weight = self.params['atr_weight']
-            weighted_sum += weight * signal
-            filter_signals['atr'] = {'weight': weight, 'signal': signal}
+        if self._atr_active and 'atr' in columns:
+            add('atr', self._w_atr, np.where(values('atr') > self._atr_min, 0.2, -0.2))
         
         # ADX (trend strength)
-        if self.params.get('adx_weight', 0) > 0.01 and 'adx' in row:
-            adx = row['adx']
-            threshold = self.params['adx_threshold']
-            if adx > threshold:
-                trend = row.get('trend', 'NEUTRAL')
-                signal = 0.5 if trend == 'BULLISH' else -0.5 if trend == 'BEARISH' else 0
-            else:
-                signal = 0.0
-            
-            weight = self.params['adx_weight']
-            weighted_sum += weight * signal
-            filter_signals['adx'] = {'weight': weight, 'signal': signal}
+        if self._adx_active and 'adx' in columns:
+            add('adx', self._w_adx, np.where(values('adx') > self._adx_threshold, 0.5 * trend_signal, 0.0))
         
         # Support/Resistance
-        if self.params.get('sr_weight', 0) > 0.01:
-            near_support = row.get('near_support', False)
-            near_resistance = row.get('near_resistance', False)
-            
-            if near_support:
-                signal = 0.7
-            elif near_resistance:
-                signal = -0.7
-            else:
-                signal = 0.0
-            
-            weight = self.params['sr_weight']
-            weighted_sum += weight * signal
-            filter_signals['sr'] = {'weight': weight, 'signal': signal}
+        if self._sr_active:
+            near_support = flags('near_support') if 'near_support' in columns else np.zeros(n, dtype=bool)
+            near_resistance = flags('near_resistance') if 'near_resistance' in columns else np.zeros(n, dtype=bool)
+            add('sr', self._w_sr, np.select([near_support, near_resistance], [0.7, -0.7], 0.0))
         
         # Momentum
-        if self.params.get('momentum_weight', 0) > 0.01 and 'momentum' in row:
-            momentum = row['momentum']
-            threshold = self.params['momentum_threshold']
-            
-            if momentum > threshold:
-                signal = min(momentum / (threshold * 2), 1.0)
-            elif momentum < -threshold:
-                signal = max(momentum / (threshold * 2), -1.0)
-            else:
-                signal = 0.0
-            
-            weight = self.params['momentum_weight']
-            weighted_sum += weight * signal
-            filter_signals['momentum'] = {'weight': weight, 'signal': signal}
+        if self._momentum_active and 'momentum' in columns:
+            momentum = values('momentum')
+            threshold = self._momentum_threshold
+            add('momentum', self._w_momentum, np.select(
+                [momentum > threshold, momentum < -threshold],
+                [np.minimum(momentum / (threshold * 2), 1.0), np.maximum(momentum / (threshold * 2), -1.0)],
+                0.0
+            ))
         
         # Market Structure
-        if self.params.get('market_structure_weight', 0) > 0.01 and 'market_structure' in row:
-            structure = row['market_structure']
-            signal = 0.8 if structure == 'BULLISH' else -0.8 if structure == 'BEARISH' else 0.0
-            
-            weight = self.params['market_structure_weight']
-            weighted_sum += weight * signal
-            filter_signals['market_structure'] = {'weight': weight, 'signal': signal}
+        if self._market_structure_active and 'market_structure' in columns:
+            add('market_structure', self._w_market_structure, 0.8 * values('market_structure'))
         
         # Time Filter
-        if self.params.get('time_filter_weight', 0) > 0.01:
-            hour = datetime.now(timezone.utc).hour  # Now it will work!
-            start_hour = int(self.params['trade_start_hour'])
-            end_hour = int(self.params['trade_end_hour'])
-            
-            if start_hour <= end_hour:
-                in_window = start_hour <= hour <= end_hour
-            else:  # Overnight trading
-                in_window = hour >= start_hour or hour <= end_hour
-            
-            signal = 0.1 if in_window else -0.5
-            
-            weight = self.params['time_filter_weight']
-            weighted_sum += weight * signal
-            filter_signals['time_filter'] = {'weight': weight, 'signal': signal}
+        if self._time_filter_active:
+            add('time_filter', self._w_time_filter, self.time_filter_signal())
         
         # MTF Confirmation (if trend data provided)
-        if self.params.get('mtf_confirmation_weight', 0) > 0.01 and trend_data:
+        if self._mtf_active and trend_data:
             # Check if trends align
-            entry_trend = row.get('trend', 'NEUTRAL')
-            higher_trend = trend_data.get('trend', 'NEUTRAL')
-            
-            if entry_trend == higher_trend and entry_trend != 'NEUTRAL':
-                signal = 0.6 if entry_trend == 'BULLISH' else -0.6
-            else:
-                signal = 0.0
-            
-            weight = self.params['mtf_confirmation_weight']
-            weighted_sum += weight * signal
-            filter_signals['mtf_confirmation'] = {'weight': weight, 'signal': signal}
+            higher_trend = np.asarray(trend_data.get('trend', 0))
+            add('mtf_confirmation', self._w_mtf,
+                np.where((trend == higher_trend) & (trend != TREND_NEUTRAL), 0.6 * trend_signal, 0.0))
         
         return weighted_sum, filter_signals
     
+    @staticmethod
+    def _trend_data_at(trend_df, position):
+        """Higher-timeframe values the scorer reads, without building a row Series"""
+        if 'trend' not in trend_df.columns:
+            return {'trend': TREND_NEUTRAL}
+        return {'trend': trend_df['trend'].to_numpy()[position]}
+    
+    @staticmethod
+    def _last_signal(weighted_sum, filter_signals):
+        """Reduce vectorized signals to the scalar result for the last row"""
+        return float(weighted_sum[-1]), {
+            name: {'weight': f['weight'], 'signal': float(f['signal'][-1])}
+            for name, f in filter_signals.items()
+        }
+    
     def get_entry_signal(self, entry_df, trend_df=None):
         """Determine if should enter position - YOUR EXACT THRESHOLDS"""
         try:
             # Get latest complete candle
-            last_row = entry_df.iloc[-1]
+            last_rows = entry_df.iloc[-1:]
             
             # Get trend data if available
             trend_data = None
             if trend_df is not None and len(trend_df) > 0:
-                trend_data = trend_df.iloc[-1].to_dict()
+                trend_data = self._trend_data_at(trend_df, -1)
             
             # Calculate weighted signal
-            weighted_sum, filter_signals = self.calculate_weighted_signal(last_row, trend_data)
+            weighted_sum, filter_signals = self._last_signal(
+                *self.calculate_weighted_signal_vec(last_rows, trend_data)
+            )
             
             # Check against threshold (BTC: 1.998, SOL: 1.984)
-            entry_threshold = self.params['entry_threshold']
+            entry_threshold = self._entry_threshold
             
             if weighted_sum > entry_threshold:
                 return 'LONG', weighted_sum, filter_signals
@@ -458,18 +602,20 @@ class IndicatorCalculator:
                 return None, 0, {}
             
             # Get PREVIOUS candle (not the latest) for signal calculation
-            prev_row = entry_df.iloc[-2]  # -2 is previous, -1 is current
+            prev_rows = entry_df.iloc[-2:-1]  # -2 is previous, -1 is current
             
             # Get trend data from previous candle if available
             trend_data = None
             if trend_df is not None and len(trend_df) > 1:
-                trend_data = trend_df.iloc[-2].to_dict()
+                trend_data = self._trend_data_at(trend_df, -2)
             
             # Calculate weighted signal using PREVIOUS candle
-            weighted_sum, filter_signals = self.calculate_weighted_signal(prev_row, trend_data)
+            weighted_sum, filter_signals = self._last_signal(
+                *self.calculate_weighted_signal_vec(prev_rows, trend_data)
+            )
             
             # Check against threshold
-            entry_threshold = self.params['entry_threshold']
+            entry_threshold = self._entry_threshold
             
             if weighted_sum > entry_threshold:
                 return 'LONG', weighted_sum, filter_signals
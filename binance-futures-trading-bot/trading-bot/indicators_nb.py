@@ -0,0 +1,246 @@
+"""
+NUMBA INDICATOR KERNELS
+=======================
+Single-pass EMA / RSI / ATR / ADX / MACD / Stochastic / Bollinger / rolling mean
+over numpy float64 arrays.
+Each kernel reproduces the pandas / `ta` output it replaces (same warm-up
+NaNs and zeros, same smoothing order), so signals are unchanged.
+Without numba installed, indicators.py keeps using `ta`.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# fastmath is deliberately off: it lets LLVM assume no NaNs, and the warm-up
+# rows of every indicator are NaN. nogil lets the bot's per-coin signal
+# threads run kernels at the same time.
+
+@njit(cache=True, nogil=True)
+def _ewm_nb(values, com, min_periods):
+    """pandas .ewm(com=com, min_periods=min_periods, adjust=False).mean()"""
+    n = values.shape[0]
+    out = np.empty(n)
+    # pandas turns span/alpha into a center of mass first; same rounding here
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    weighted = np.nan
+    old_wt = 1.0
+    nobs = 0
+    min_periods = max(min_periods, 1)
+    for i in range(n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = old_wt * weighted + alpha * cur
+                    weighted /= old_wt + alpha
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ewm_span_nb(values, span, min_periods=0):
+    """pandas .ewm(span=span, min_periods=min_periods, adjust=False).mean()"""
+    return _ewm_nb(values, (span - 1) / 2.0, min_periods)
+
+
+@njit(cache=True, nogil=True)
+def rsi_nb(close, n):
+    """ta.momentum.RSIIndicator(close, window=n).rsi()"""
+    size = close.shape[0]
+    up = np.zeros(size)
+    down = np.zeros(size)
+    for i in range(1, size):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            up[i] = diff
+        elif diff < 0:
+            down[i] = -diff
+    # alpha = 1/n (Wilder smoothing)
+    alpha = 1 / n
+    emaup = _ewm_nb(up, (1 - alpha) / alpha, n)
+    emadn = _ewm_nb(down, (1 - alpha) / alpha, n)
+    out = np.empty(size)
+    for i in range(size):
+        if emadn[i] == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100 - (100 / (1 + emaup[i] / emadn[i]))
+    return out
+
+
+@njit(cache=True, nogil=True)
+def macd_nb(close, fast, slow, signal):
+    """ta.trend.MACD(close, slow, fast, signal).macd_diff()"""
+    # ta's EMAs wait for a full span before emitting values
+    macd = ewm_span_nb(close, fast, fast) - ewm_span_nb(close, slow, slow)
+    return macd - ewm_span_nb(macd, signal, signal)
+
+
+@njit(cache=True, nogil=True)
+def stoch_nb(high, low, close, k):
+    """ta.momentum.StochasticOscillator(high, low, close, window=k).stoch()"""
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    for i in range(k - 1, size):
+        lowest = low[i - k + 1]
+        highest = high[i - k + 1]
+        for j in range(i - k + 2, i + 1):
+            if low[j] < lowest:
+                lowest = low[j]
+            if high[j] > highest:
+                highest = high[j]
+        # A flat window is 0/0 in ta (NaN); compiled code would raise instead
+        if highest == lowest:
+            continue
+        out[i] = 100 * (close[i] - lowest) / (highest - lowest)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_nb(values, n):
+    """series.rolling(window=n).mean()"""
+    size = values.shape[0]
+    out = np.full(size, np.nan)
+    for i in range(n - 1, size):
+        total = 0.0
+        for j in range(i - n + 1, i + 1):
+            total += values[j]
+        out[i] = total / n
+    return out
+
+
+@njit(cache=True, nogil=True)
+def bollinger_nb(close, n, ndev):
+    """ta.volatility.BollingerBands(close, window=n, window_dev=ndev) upper, lower and width bands"""
+    size = close.shape[0]
+    upper = np.full(size, np.nan)
+    lower = np.full(size, np.nan)
+    width = np.full(size, np.nan)
+    for i in range(n - 1, size):
+        total = 0.0
+        for j in range(i - n + 1, i + 1):
+            total += close[j]
+        mavg = total / n
+        # Population std (ddof=0), two-pass over the window
+        sq = 0.0
+        for j in range(i - n + 1, i + 1):
+            d = close[j] - mavg
+            sq += d * d
+        mstd = np.sqrt(sq / n)
+        upper[i] = mavg + ndev * mstd
+        lower[i] = mavg - ndev * mstd
+        if mavg != 0:
+            width[i] = (upper[i] - lower[i]) / mavg * 100
+    return upper, lower, width
+
+
+@njit(cache=True, nogil=True)
+def _true_range_nb(high, low, close):
+    size = close.shape[0]
+    tr = np.empty(size)
+    if size:
+        tr[0] = high[0] - low[0]
+    for i in range(1, size):
+        tr[i] = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    return tr
+
+
+@njit(cache=True, nogil=True)
+def atr_nb(high, low, close, n):
+    """ta.volatility.AverageTrueRange(high, low, close, window=n).average_true_range()"""
+    tr = _true_range_nb(high, low, close)
+    atr = np.zeros(close.shape[0])
+    # No bounds checks in compiled code, so never index past a short input
+    if close.shape[0] < n:
+        return atr
+    atr[n - 1] = np.mean(tr[0:n])
+    for i in range(n, close.shape[0]):
+        atr[i] = (atr[i - 1] * (n - 1) + tr[i]) / float(n)
+    return atr
+
+
+@njit(cache=True, nogil=True)
+def adx_nb(high, low, close, n):
+    """ta.trend.ADXIndicator(high, low, close, window=n).adx()"""
+    size = close.shape[0]
+    length = size - (n - 1)
+    if length <= n:
+        raise ValueError("not enough candles for ADX")
+
+    # True range and directional movement; index 0 has no previous candle
+    tr = np.empty(size)
+    pos = np.empty(size)
+    neg = np.empty(size)
+    for i in range(1, size):
+        tr[i] = max(high[i], close[i - 1]) - min(low[i], close[i - 1])
+        diff_up = high[i] - high[i - 1]
+        diff_down = low[i - 1] - low[i]
+        pos[i] = diff_up if (diff_up > diff_down and diff_up > 0) else 0.0
+        neg[i] = diff_down if (diff_down > diff_up and diff_down > 0) else 0.0
+
+    # Wilder running sums; ta leaves the final slot at 0
+    trs = np.zeros(length)
+    dip = np.zeros(length)
+    din = np.zeros(length)
+    trs[0] = np.sum(tr[1:n + 1])
+    dip[0] = np.sum(pos[1:n + 1])
+    din[0] = np.sum(neg[1:n + 1])
+    for i in range(1, length - 1):
+        trs[i] = trs[i - 1] - (trs[i - 1] / float(n)) + tr[n + i]
+        dip[i] = dip[i - 1] - (dip[i - 1] / float(n)) + pos[n + i]
+        din[i] = din[i - 1] - (din[i - 1] / float(n)) + neg[n + i]
+
+    directional_index = np.zeros(length)
+    for i in range(length):
+        if trs[i] != 0:
+            di_pos = 100 * (dip[i] / trs[i])
+            di_neg = 100 * (din[i] / trs[i])
+        else:
+            di_pos = 0.0
+            di_neg = 0.0
+        if di_pos + di_neg != 0:
+            directional_index[i] = 100 * np.abs((di_pos - di_neg) / (di_pos + di_neg))
+
+    out = np.zeros(size)
+    adx = out[n - 1:]
+    adx[n] = np.mean(directional_index[0:n])
+    for i in range(n + 1, length):
+        adx[i] = ((adx[i - 1] * (n - 1)) + directional_index[i - 1]) / float(n)
+    return out
+
+
+def warmup():
+    """Compile every kernel once so the first live candle doesn't pay the JIT cost."""
+    if not NUMBA_AVAILABLE:
+        return
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 64))
+    high = close + 1.0
+    low = close - 1.0
+    ewm_span_nb(close, 20)
+    rsi_nb(close, 14)
+    macd_nb(close, 12, 26, 9)
+    stoch_nb(high, low, close, 14)
+    rolling_mean_nb(close, 20)
+    bollinger_nb(close, 20, 2.0)
+    atr_nb(high, low, close, 14)
+    adx_nb(high, low, close, 14)
@@ -13,26 +13,35 @@ KEY CHANGES FROM ORIGINAL:
 5. Exit reasons now include "SIGNAL_REVERSAL" in addition to TP/SL/MANUAL
 """
 
-import json
+import atexit
+import functools
 import time
 import logging
 import re
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Tuple
 import threading
+import queue
 import signal
 import sys
+import numpy as np
+import orjson
 import pandas as pd
 import platform
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from pathlib import Path
 
 from binance import ThreadedWebsocketManager
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from decimal import Decimal, ROUND_DOWN
+from requests.adapters import HTTPAdapter
 
 PROJECT_ROOT = next(
     (parent for parent in Path(__file__).resolve().parents if (parent / "spy_integration.py").exists()),
@@ -55,7 +64,8 @@ from runtime_config import (
 
 api_key, secret_key = get_binance_credentials(USE_TESTNET)
     
-from indicators import IndicatorCalculator
+from indicators import CANDLE_COLUMNS, IndicatorCalculator
+import indicators_nb
 from telegram_notifier import notifier
 from stats import stats_tracker
 from enhanced_stats import enhanced_stats
@@ -99,15 +109,42 @@ console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
 handlers.append(console_handler)
 
-# Configure root logger
+# Configure root logger. Records go through a queue and a listener thread
+# writes them to the file/console handlers, so trading threads never block
+# on log I/O; atexit stops the listener after draining what's queued.
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# QueueHandler pre-renders the message; the listener's handlers add the layout
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    handlers=handlers
+    handlers=[queue_handler]
 )
 
 logger = logging.getLogger(__name__)
 RATE_LIMIT_BAN_UNTIL_RE = re.compile(r"banned until (\d+)")
 SPY_BIAS_CLOSE_RECHECK_SECONDS = 30
+# Finished orders drop out of user_order_cache after this long; open ones stay
+ORDER_CACHE_TTL_SECONDS = 3600
+ORDER_CACHE_PRUNE_INTERVAL_SECONDS = 60
+# Lot/tick filters rarely change; re-read exchange info this often
+EXCHANGE_RULES_REFRESH_SECONDS = 3600
+# Streamed last prices older than this fall back to a REST ticker call
+LIVE_PRICE_MAX_AGE_SECONDS = 5
+# Candle closes delivered later than this are logged as late
+KLINE_STALE_EVENT_MS = 5000
+# No market-stream message for this long restarts the combined socket
+MARKET_STREAM_SILENCE_SECONDS = 60
+TIMEFRAME_MS = {
+    '1m': 60_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000,
+}
+TERMINAL_ORDER_STATUSES = frozenset({'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'})
 
 
 def is_rate_limit_error(exc):
@@ -201,18 +238,32 @@ def extract_order_trigger_price(order_payload):
         return None
 
 # ========================================
-# DATABASE CLEANUP FUNCTION (NEW)
+# DATABASE CONNECTION
 # ========================================
-def cleanup_old_trades(days_to_keep=30):
-    """Remove trades older than specified days from database"""
-    if not DATABASE_ENABLED:
-        return
-    try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
+# One connection for the bot's trade writes, opened on first use and shared
+# across threads under _db_lock. WAL keeps the web server's readers from
+# blocking on our commits.
+_db_lock = threading.Lock()
+_db_conn = None
+
+# Trade rows are queued by save_trade_to_db and written in batches by a
+# daemon thread, so closing a position never waits on a disk sync.
+TRADE_FLUSH_INTERVAL = 2.0
+TRADE_FLUSH_BATCH = 50
+_pending_trades = queue.Queue()
+_flush_thread = None
+_flush_thread_lock = threading.Lock()
+
+def _get_db():
+    """Return the shared trades.db connection; callers hold _db_lock"""
+    global _db_conn
+    if _db_conn is None:
+        conn = sqlite3.connect(DATABASE_FILE, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
         
         # Create table if not exists (removed DEFAULT CURRENT_TIMESTAMP)
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS trades (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp DATETIME,
@@ -225,55 +276,127 @@ def cleanup_old_trades(days_to_keep=30):
                 exit_type TEXT
             )
         ''')
-        
+        conn.commit()
+        _db_conn = conn
+    return _db_conn
+
+def _drop_db():
+    """Close the shared connection after an error so the next write reopens it; callers hold _db_lock"""
+    global _db_conn
+    if _db_conn is not None:
+        try:
+            _db_conn.close()
+        except Exception:
+            pass
+        _db_conn = None
+
+# ========================================
+# DATABASE CLEANUP FUNCTION (NEW)
+# ========================================
+def cleanup_old_trades(days_to_keep=30):
+    """Remove trades older than specified days from database"""
+    if not DATABASE_ENABLED:
+        return
+    try:
         # Delete old trades (using UTC)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
-        cursor.execute(
-            "DELETE FROM trades WHERE timestamp < ?", 
-            (cutoff_date.strftime('%Y-%m-%d %H:%M:%S'),)
-        )
-        
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with _db_lock:
+            try:
+                conn = _get_db()
+                cursor = conn.execute(
+                    "DELETE FROM trades WHERE timestamp < ?", 
+                    (cutoff_date.strftime('%Y-%m-%d %H:%M:%S'),)
+                )
+                deleted = cursor.rowcount
+                conn.commit()
+            except sqlite3.Error:
+                _drop_db()
+                raise
         
         if deleted > 0:
-            logger.info(f"🧹 Cleaned up {deleted} old trades from database")
+            logger.info("🧹 Cleaned up %d old trades from database", deleted)
             
     except Exception as e:
-        logger.error(f"Database cleanup error: {e}")
+        logger.error("Database cleanup error: %s", e)
+
+def _flush_trades(batch):
+    """Write queued trade rows in one transaction"""
+    if not batch:
+        return
+    try:
+        with _db_lock:
+            try:
+                conn = _get_db()
+                conn.executemany('''
+                    INSERT INTO trades (timestamp, coin, side, entry_price, exit_price, pnl_pct, pnl_value, exit_type)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', batch)
+                conn.commit()
+            except sqlite3.Error:
+                _drop_db()
+                raise
+    except Exception as e:
+        logger.error("Database save error (%d trades): %s", len(batch), e)
+
+def _drain_pending_trades(batch):
+    """Move everything currently queued into batch; returns the shutdown-flush event if one was queued"""
+    flushed = None
+    while True:
+        try:
+            item = _pending_trades.get_nowait()
+        except queue.Empty:
+            return flushed
+        if isinstance(item, threading.Event):
+            flushed = item
+        else:
+            batch.append(item)
+
+def _trade_flush_loop():
+    """Flush queued trades every TRADE_FLUSH_INTERVAL seconds or once TRADE_FLUSH_BATCH are waiting"""
+    while True:
+        batch = []
+        flushed = None
+        item = _pending_trades.get()
+        deadline = time.monotonic() + TRADE_FLUSH_INTERVAL
+        while True:
+            if isinstance(item, threading.Event):
+                flushed = item
+                break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= TRADE_FLUSH_BATCH or remaining <= 0:
+                break
+            try:
+                item = _pending_trades.get(timeout=remaining)
+            except queue.Empty:
+                break
+        flushed = _drain_pending_trades(batch) or flushed
+        _flush_trades(batch)
+        if flushed is not None:
+            flushed.set()
+
+def flush_pending_trades(timeout=5.0):
+    """Write any queued trades now (used on shutdown)"""
+    if _flush_thread is None:
+        batch = []
+        _drain_pending_trades(batch)
+        _flush_trades(batch)
+        return
+    # Hand the flush to the writer thread so rows it is already holding aren't lost
+    flushed = threading.Event()
+    _pending_trades.put(flushed)
+    if not flushed.wait(timeout):
+        logger.warning("⚠️ Timed out flushing queued trades to the database")
 
 def save_trade_to_db(trade_data):
-    """Save trade to database with UTC timestamp"""
+    """Queue trade for the database with UTC timestamp"""
+    global _flush_thread
     if not DATABASE_ENABLED:
         return
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        
-        # Create table if not exists (removed DEFAULT CURRENT_TIMESTAMP)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME,
-                coin TEXT,
-                side TEXT,
-                entry_price REAL,
-                exit_price REAL,
-                pnl_pct REAL,
-                pnl_value REAL,
-                exit_type TEXT
-            )
-        ''')
-        
         # Get UTC timestamp explicitly
         utc_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Insert trade with UTC timestamp
-        cursor.execute('''
-            INSERT INTO trades (timestamp, coin, side, entry_price, exit_price, pnl_pct, pnl_value, exit_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        _pending_trades.put((
             utc_timestamp,  # Now explicitly UTC
             trade_data['coin'],
             trade_data['side'],
@@ -284,75 +407,201 @@ def save_trade_to_db(trade_data):
             trade_data['exit_type']
         ))
         
-        conn.commit()
-        conn.close()
+        if _flush_thread is None:
+            with _flush_thread_lock:
+                if _flush_thread is None:
+                    _flush_thread = threading.Thread(target=_trade_flush_loop, name="trade-db-flush", daemon=True)
+                    _flush_thread.start()
         
     except Exception as e:
-        logger.error(f"Database save error: {e}")
+        logger.error("Database save error: %s", e)
+
+# ========================================
+# CANDLE BUFFER
+# ========================================
+class CandleBuffer:
+    """
+    Closed candles for one symbol/timeframe, newest last: int64 open times
+    (ms) plus float64 OHLCV rows in preallocated arrays. Storage is twice
+    the capacity, so appends just write the next row and the live window
+    only slides back to the front once per `capacity` candles.
+    """
+    
+    __slots__ = ('capacity', 'times', 'values', 'start', 'end')
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.times = np.empty(2 * capacity, dtype=np.int64)
+        self.values = np.empty((2 * capacity, len(CANDLE_COLUMNS)), dtype=np.float64)
+        self.start = 0
+        self.end = 0
+    
+    def __len__(self):
+        return self.end - self.start
+    
+    def _reset(self, times, values):
+        n = min(len(times), self.capacity)
+        self.times[:n] = times[len(times) - n:]
+        self.values[:n] = values[len(values) - n:]
+        self.start = 0
+        self.end = n
+    
+    def load(self, df):
+        """Replace the contents with the newest `capacity` rows of a kline frame"""
+        self._reset(df.index.to_numpy(dtype=np.int64), df[CANDLE_COLUMNS].to_numpy(dtype=np.float64))
+    
+    def upsert(self, open_time, row):
+        """Insert or replace the candle opened at open_time (ms)"""
+        if self.end > self.start and open_time <= self.times[self.end - 1]:
+            live_times = self.times[self.start:self.end]
+            pos = int(np.searchsorted(live_times, open_time))
+            if live_times[pos] == open_time:
+                self.values[self.start + pos] = row
+            else:
+                # Out-of-order candle (rare): rebuild the window with it inserted
+                self._reset(
+                    np.insert(live_times, pos, open_time),
+                    np.insert(self.values[self.start:self.end], pos, row, axis=0)
+                )
+            return
+        
+        if self.end == len(self.times):
+            keep = min(len(self), self.capacity - 1)
+            self.times[:keep] = self.times[self.end - keep:self.end]
+            self.values[:keep] = self.values[self.end - keep:self.end]
+            self.start = 0
+            self.end = keep
+        self.times[self.end] = open_time
+        self.values[self.end] = row
+        self.end += 1
+        if len(self) > self.capacity:
+            self.start += 1
+    
+    def to_frame(self):
+        """Snapshot as a kline frame (copied, so later upserts don't change it)"""
+        return pd.DataFrame(
+            self.values[self.start:self.end].copy(),
+            columns=CANDLE_COLUMNS,
+            index=pd.Index(self.times[self.start:self.end].copy(), name='timestamp')
+        )
+
+# ========================================
+# PARAMETER FILES
+# ========================================
+def _freeze(value):
+    """Read-only view of parsed JSON: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+@functools.lru_cache(maxsize=128)
+def _load_parameters_cached(path, mtime_ns):
+    """Parse a parameter file once per (path, mtime); the result is shared, so it is frozen"""
+    with open(path, 'rb') as f:
+        return _freeze(orjson.loads(f.read()))
 
 # ========================================
 # POSITION TRACKER
 # ========================================
+@dataclass(slots=True)
+class Position:
+    """One open position as tracked by the bot"""
+    side: str  # 'LONG' / 'SHORT'
+    entry_price: float
+    quantity: float
+    entry_time: datetime
+    entry_order_id: Optional[str]
+    tp_order_id: Optional[str]
+    sl_order_id: Optional[str]
+    tp_price: float
+    sl_price: float
+    restored_from_exchange: bool = False
+    protection_reconciled: bool = True
+    # Monotonic clock at tracking start, for age checks; entry_time is for display/DB
+    entry_mono_ns: int = field(default_factory=time.monotonic_ns)
+
 class PositionTracker:
     """Tracks open positions for each coin"""
     
+    # No lock: every method is a single dict operation (get / in / len /
+    # setitem / pop / copy), each atomic under the GIL. add_position's
+    # duplicate check is the one read-then-write, and entries are already
+    # serialized by TradingBot.entry_lock.
+    # Removed Position objects are not pooled for reuse: references handed
+    # out by get_position / get_all_positions can outlive the removal on
+    # another thread, and a recycled object would change under them.
+    
+    __slots__ = ('positions', '_recent_adds')
+    
+    # A repeat add for the same coin and TP/SL orders within this window is dropped
+    DUPLICATE_ADD_WINDOW_SECONDS = 2.0
+    RECENT_ADDS_TTL_SECONDS = 60.0
+    
     def __init__(self):
-        self.positions = {}  # {coin: position_data}
-        self.lock = threading.Lock()
+        self.positions = {}  # {coin: Position}
+        self._recent_adds = {}  # {(coin, tp_order_id, sl_order_id): monotonic time}
     
     def has_position(self, coin):
         """Check if coin has open position"""
-        with self.lock:
-            return coin in self.positions and self.positions[coin] is not None
+        return self.positions.get(coin) is not None
     
     def add_position(self, coin, data):
         """Add new position"""
-        with self.lock:
-            self.positions[coin] = data
-            logger.info(f"📈 Position opened: {coin} - {data['side']} @ ${data['entry_price']:.2f}")
-            logger.info(f"   TP Order ID: {format_order_reference(data.get('tp_order_id'))}")
-            logger.info(f"   SL Order ID: {format_order_reference(data.get('sl_order_id'))}")
+        now = time.monotonic()
+        key = (coin, data.tp_order_id, data.sl_order_id)
+        added_at = self._recent_adds.get(key)
+        if added_at is not None and now - added_at < self.DUPLICATE_ADD_WINDOW_SECONDS:
+            logger.warning("⚠️ Ignoring duplicate position open for %s (same TP/SL orders)", coin)
+            return
+        if len(self._recent_adds) > len(self.positions) + 16:
+            self._recent_adds = {
+                k: t for k, t in self._recent_adds.items() if now - t < self.RECENT_ADDS_TTL_SECONDS
+            }
+        self._recent_adds[key] = now
+        self.positions[coin] = data
+        # One record, %-formatted so nothing is built when INFO is filtered out
+        logger.info(
+            "📈 Position opened: %s - %s @ $%.2f | TP Order ID: %s | SL Order ID: %s",
+            coin, data.side, data.entry_price,
+            format_order_reference(data.tp_order_id), format_order_reference(data.sl_order_id)
+        )
 
     def restore_position(self, coin, data):
         """Restore an already-open exchange position into local bot state."""
-        with self.lock:
-            self.positions[coin] = data
+        self.positions[coin] = data
 
-        protection_status = "protected" if data.get('tp_order_id') and data.get('sl_order_id') else "missing-protection"
+        protection_status = "protected" if data.tp_order_id and data.sl_order_id else "missing-protection"
         logger.warning(
-            f"♻️ Restored Binance position: {coin} - {data['side']} @ ${data['entry_price']:.2f} "
-            f"| qty={data['quantity']:.6f} | protection={protection_status}"
+            "♻️ Restored Binance position: %s - %s @ $%.2f | qty=%.6f | protection=%s "
+            "| TP Order ID: %s | SL Order ID: %s",
+            coin, data.side, data.entry_price, data.quantity, protection_status,
+            format_order_reference(data.tp_order_id), format_order_reference(data.sl_order_id)
         )
-        logger.info(f"   Restored TP Order ID: {format_order_reference(data.get('tp_order_id'))}")
-        logger.info(f"   Restored SL Order ID: {format_order_reference(data.get('sl_order_id'))}")
     
     def remove_position(self, coin):
         """Remove closed position"""
-        with self.lock:
-            if coin in self.positions:
-                del self.positions[coin]
-                logger.info(f"📉 Position closed: {coin}")
+        if self.positions.pop(coin, None) is not None:
+            logger.info("📉 Position closed: %s", coin)
     
     def get_position(self, coin):
-        """Get position data"""
-        with self.lock:
-            return self.positions.get(coin)
+        """Get the live Position; callers may hold it and set attributes directly"""
+        return self.positions.get(coin)
     
     def update_position(self, coin, key, value):
-        """Update specific position data"""
-        with self.lock:
-            if coin in self.positions:
-                self.positions[coin][key] = value
+        """Update specific position data (kept for callers that only have the coin)"""
+        data = self.positions.get(coin)
+        if data is not None:
+            setattr(data, key, value)
     
     def total_positions(self):
         """Count total open positions"""
-        with self.lock:
-            return len(self.positions)
+        return len(self.positions)
 
     def get_all_positions(self):
         """Return a shallow copy of tracked open positions."""
-        with self.lock:
-            return dict(self.positions)
+        return self.positions.copy()
 
 # ========================================
 # COIN MANAGER
@@ -360,34 +609,53 @@ class PositionTracker:
 class CoinManager:
     """Manages parameters and state for each coin"""
     
+    __slots__ = (
+        'coin', 'params', 'indicator_calc',
+        'entry_candles', 'trend_candles', 'data_lock',
+        'timeframe_combo_id', 'entry_timeframe', 'trend_timeframe',
+        'tp_percent', 'sl_percent', 'entry_threshold', 'exit_multipliers',
+    )
+    
     def __init__(self, coin, param_file):
-        self.coin = coin
+        self.coin = sys.intern(coin)
         self.params = self.load_parameters(param_file)
-        self.latest_candles = {}  # Store latest candle data
-        self.indicators = {}      # Store calculated indicators
-        self.last_signal = None   # Track last signal to avoid duplicates
         
         # Initialize indicator calculator
         self.indicator_calc = IndicatorCalculator(coin, self.params)
         
-        # Store dataframes and track candle closes
-        self.entry_df = None  # Store entry timeframe data
-        self.trend_df = None  # Store trend timeframe data
-        self.candle_closed = {'entry': False, 'trend': False}  # Track closed candles
+        # Closed candles per timeframe, kept live by WebSocket closes
+        self.entry_candles = CandleBuffer(CANDLES_REQUIRED + 5)
+        self.trend_candles = CandleBuffer(CANDLES_REQUIRED + 5)
         self.data_lock = threading.Lock()
         
+        # Parameters read on the trading path, resolved once
+        params = self.params['parameters']
+        self.tp_percent = params['tp_percent']
+        self.sl_percent = params['sl_percent']
+        self.entry_threshold = params['entry_threshold']
+        # side -> (TP, SL) price multipliers on the entry price
+        self.exit_multipliers = {
+            'LONG': (1 + self.tp_percent, 1 - self.sl_percent),
+            'SHORT': (1 - self.tp_percent, 1 + self.sl_percent),
+        }
+        
         # Extract timeframes
-        tf_combo = TIMEFRAME_MAP[int(self.params['parameters']['timeframe_combo'])]
+        self.timeframe_combo_id = int(params['timeframe_combo'])
+        tf_combo = TIMEFRAME_MAP_TUPLE[self.timeframe_combo_id]
         self.entry_timeframe = tf_combo['entry']
         self.trend_timeframe = tf_combo['trend']
         
-        logger.info(f"✅ Loaded {coin}: Entry={self.entry_timeframe}, Trend={self.trend_timeframe}")
-        logger.info(f"   TP: {self.params['parameters']['tp_percent']*100:.2f}% | SL: {self.params['parameters']['sl_percent']*100:.2f}%")
+        logger.info("✅ Loaded %s: Entry=%s, Trend=%s", coin, self.entry_timeframe, self.trend_timeframe)
+        logger.info("   TP: %.2f%% | SL: %.2f%%", self.tp_percent * 100, self.sl_percent * 100)
+    
+    def exit_prices(self, side, entry_price):
+        """Raw (tp_price, sl_price) for a 'LONG' / 'SHORT' entry"""
+        tp_mul, sl_mul = self.exit_multipliers[side]
+        return entry_price * tp_mul, entry_price * sl_mul
     
     def load_parameters(self, param_file):
-        """Load parameters from JSON file"""
-        with open(param_file, 'r') as f:
-            return json.load(f)
+        """Load parameters from JSON file (shared, read-only)"""
+        return _load_parameters_cached(os.fspath(param_file), os.stat(param_file).st_mtime_ns)
 
 # ========================================
 # MAIN TRADING BOT - REVERSAL VERSION
@@ -419,6 +687,12 @@ class TradingBot:
             logger.info(f"📍 Connected to: {TESTNET_BASE_URL}")
         else:
             self.client = Client(api_key, secret_key)
+        # Signal workers, order_executor and the trading loop share this session;
+        # requests keeps only 10 sockets per host, so size the pool for that fan-out
+        self.client.session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        )
+        self.client.session.headers["Connection"] = "keep-alive"
         
         # Initialize components
         self.position_tracker = PositionTracker()
@@ -428,15 +702,39 @@ class TradingBot:
         self.daily_pnl = 0
         self.ws_manager = None
         self.ws_streams = []
+        self.market_stream_name = None
+        self.market_stream_last_message_at = 0.0
         self.rest_backoff_until = 0.0
         self.symbol_exchange_rules = {}
+        self.symbol_exchange_rules_loaded_at = 0.0
         self.user_order_cache = {}
+        self.last_order_cache_prune = 0.0
         self.user_stream_name = None
         self.user_stream_started_at = 0.0
         self.user_stream_last_message_at = 0.0
+        self.live_prices = {}  # {coin: (last_price, received_at)} from the ticker streams
         
         # OPTIMIZATION ALIGNMENT: Pending signals for delayed execution
-        self.pending_signals = {}  # {coin: {'signal': 'LONG/SHORT', 'strength': float, 'filters': dict}}
+        # One slot per coin, None when empty; only touched under entry_lock
+        self.pending_signals = dict.fromkeys(ACTIVE_COINS)  # {coin: {'signal': 'LONG/SHORT', 'strength': float, 'filters': dict} | None}
+        
+        # Candle closes land for every coin at once; indicators for each coin run on
+        # this pool in parallel, while entry decisions stay serialized under entry_lock
+        # so balance/position-limit checks never race.
+        self.signal_executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(ACTIVE_COINS), os.cpu_count() or 1)),
+            thread_name_prefix="signals"
+        )
+        self.entry_lock = threading.Lock()
+        # Separate from signal_executor: entries run on that pool and wait on this one
+        self.order_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="orders")
+        # One worker, so exits are recorded in the order they happened
+        self.post_exit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="post-exit")
+        # Exit checks block on REST order lookups, so fan out one per open position
+        self.exit_check_executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(ACTIVE_COINS), MAX_TOTAL_POSITIONS)),
+            thread_name_prefix="exit-checks"
+        )
         self.spy_regime_filter = SpyRegimeFilter(PROJECT_ROOT)
         self.active_spy_regime = None
         self.pending_spy_bias_close = None
@@ -444,11 +742,16 @@ class TradingBot:
         stats_tracker.update_position_tracker(self.position_tracker)
 
         
-        # Schedule daily cleanup at midnight
-        self.last_cleanup = datetime.now(timezone.utc).date()
+        # Daily cleanup + summary timer, armed in start() for the next UTC midnight
+        self.daily_maintenance_timer = None
         
         # Load coin configurations
         self.load_coins()
+        # Fixed after load_coins, so built once for the trading-loop banner
+        self.threshold_log = ", ".join(
+            f"{coin.replace('USDC','')}={manager.entry_threshold:.3f}"
+            for coin, manager in self.coin_managers.items()
+        )
         self.load_symbol_exchange_rules()
         
         # Wait through startup-time Binance REST rate limits instead of exiting and
@@ -491,11 +794,10 @@ class TradingBot:
 
     def calculate_unrealized_position_pnl(self, coin, position):
         """Calculate the latest unrealized PnL for one tracked position."""
-        ticker = self.client.futures_symbol_ticker(symbol=coin)
-        current_price = float(ticker['price'])
-        entry_price = float(position['entry_price'])
+        current_price = self.get_current_price(coin)
+        entry_price = float(position.entry_price)
 
-        if position['side'] == 'LONG':
+        if position.side == 'LONG':
             pnl_pct = ((current_price - entry_price) / entry_price) * 100
         else:
             pnl_pct = ((entry_price - current_price) / entry_price) * 100
@@ -512,7 +814,7 @@ class TradingBot:
             current_price, pnl_pct, pnl_value = self.calculate_unrealized_position_pnl(coin, position)
             basket_snapshots.append({
                 'coin': coin,
-                'side': position['side'],
+                'side': position.side,
                 'current_price': current_price,
                 'pnl_pct': pnl_pct,
                 'pnl_value': pnl_value,
@@ -594,7 +896,7 @@ class TradingBot:
 
         conflicting_positions = [
             coin for coin, position in active_positions.items()
-            if self.position_conflicts_with_regime(position['side'], current_regime.get('regime'))
+            if self.position_conflicts_with_regime(position.side, current_regime.get('regime'))
         ]
         if not conflicting_positions:
             self.clear_pending_spy_bias_close("active positions align with the current SPY regime")
@@ -634,7 +936,7 @@ class TradingBot:
 
         conflicting_positions = [
             coin for coin, position in active_positions.items()
-            if self.position_conflicts_with_regime(position['side'], regime.get('regime'))
+            if self.position_conflicts_with_regime(position.side, regime.get('regime'))
         ]
         if not conflicting_positions:
             return
@@ -712,7 +1014,7 @@ class TradingBot:
 
         conflicting_positions = [
             coin for coin, position in active_positions.items()
-            if self.position_conflicts_with_regime(position['side'], current_regime.get('regime'))
+            if self.position_conflicts_with_regime(position.side, current_regime.get('regime'))
         ]
         if not conflicting_positions:
             logger.info("🧭 SPY bias changed but active positions already align with the new regime")
@@ -820,6 +1122,7 @@ class TradingBot:
                 coin = symbol.get('symbol')
                 if coin not in ACTIVE_COINS:
                     continue
+                coin = sys.intern(coin)
 
                 filters = {item['filterType']: item for item in symbol.get('filters', [])}
                 lot_filter = filters.get('LOT_SIZE', {})
@@ -839,6 +1142,7 @@ class TradingBot:
                 }
 
             self.symbol_exchange_rules = rules
+            self.symbol_exchange_rules_loaded_at = time.time()
             logger.info(f"✅ Cached exchange rules for {len(rules)} active symbols")
 
         except Exception as exc:
@@ -931,6 +1235,17 @@ class TradingBot:
                 return cached.get('status')
         return None
 
+    def prune_order_cache(self, now):
+        """Forget finished orders older than ORDER_CACHE_TTL_SECONDS so the cache stays bounded over long uptimes."""
+        cutoff = now - ORDER_CACHE_TTL_SECONDS
+        stale = [
+            reference for reference, cached in list(self.user_order_cache.items())
+            if cached.get('status') in TERMINAL_ORDER_STATUSES and cached.get('updated_at', 0) < cutoff
+        ]
+        for reference in stale:
+            self.user_order_cache.pop(reference, None)
+        self.last_order_cache_prune = now
+
     def user_stream_healthy(self):
         """Whether the futures user-data stream is recent enough to trust over REST."""
         if not self.user_stream_name:
@@ -995,44 +1310,45 @@ class TradingBot:
                 time.sleep(API_DELAY)
 
             with manager.data_lock:
-                manager.entry_df = buffers[manager.entry_timeframe].copy()
-                manager.trend_df = buffers[manager.trend_timeframe].copy()
+                manager.entry_candles.load(buffers[manager.entry_timeframe])
+                manager.trend_candles.load(buffers[manager.trend_timeframe])
 
         logger.info(f"✅ Loaded initial candle buffers for {loaded_pairs} symbol/timeframe pairs")
 
-    def upsert_closed_candle(self, df, kline):
-        """Insert or replace a closed candle in an in-memory dataframe."""
-        candle_time = pd.to_datetime(int(kline['t']), unit='ms')
-        candle_row = pd.DataFrame(
-            [{
-                'open': float(kline['o']),
-                'high': float(kline['h']),
-                'low': float(kline['l']),
-                'close': float(kline['c']),
-                'volume': float(kline['v']),
-            }],
-            index=[candle_time],
-        )
-
-        if df is None or df.empty:
-            updated = candle_row
-        else:
-            updated = pd.concat([df[df.index != candle_time], candle_row]).sort_index()
-
-        max_rows = CANDLES_REQUIRED + 5
-        if len(updated) > max_rows:
-            updated = updated.iloc[-max_rows:]
-
-        return updated
+    def resync_candle_buffer(self, coin, timeframe, last_closed_time):
+        """Reload one coin/timeframe buffer from REST after missed candle closes."""
+        if self.rest_backoff_active():
+            logger.warning("⚠️ %s %s candle gap not refilled: Binance REST is rate-limited", coin, timeframe)
+            return
+        manager = self.coin_managers[coin]
+        try:
+            df = manager.indicator_calc.fetch_historical_data(self.client, timeframe, limit=CANDLES_REQUIRED)
+        except Exception as exc:
+            if is_rate_limit_error(exc):
+                self.note_rate_limit(f"candle resync {coin} {timeframe}", exc, fallback_seconds=60)
+            logger.warning(f"⚠️ {coin} {timeframe} candle gap not refilled: {exc}")
+            return
+        if df is None or len(df) < 2:
+            return
+        # Drop the candle that opened after this close; it is still in progress
+        df = df[df.index <= last_closed_time]
+        with manager.data_lock:
+            if timeframe == manager.entry_timeframe:
+                manager.entry_candles.load(df)
+            if timeframe == manager.trend_timeframe:
+                manager.trend_candles.load(df)
+        logger.info("🔄 %s %s candle buffer refilled after a gap", coin, timeframe)
 
     def update_candle_buffers(self, coin, timeframe, kline):
         """Update cached indicator inputs from a closed WebSocket candle."""
         manager = self.coin_managers[coin]
+        candle_time = int(kline['t'])  # open time in ms, same index as fetch_historical_data
+        row = (float(kline['o']), float(kline['h']), float(kline['l']), float(kline['c']), float(kline['v']))
         with manager.data_lock:
             if timeframe == manager.entry_timeframe:
-                manager.entry_df = self.upsert_closed_candle(manager.entry_df, kline)
+                manager.entry_candles.upsert(candle_time, row)
             if timeframe == manager.trend_timeframe:
-                manager.trend_df = self.upsert_closed_candle(manager.trend_df, kline)
+                manager.trend_candles.upsert(candle_time, row)
     
     def load_coins(self):
         """Load all coin configurations"""
@@ -1134,19 +1450,8 @@ class TradingBot:
 
     def derive_expected_exit_price(self, coin, side, exit_type, entry_price):
         """Fallback TP/SL price when an imported order does not expose stopPrice."""
-        params = self.coin_managers[coin].params['parameters']
-        if side == 'LONG':
-            raw_price = (
-                entry_price * (1 + params['tp_percent'])
-                if exit_type == 'TP'
-                else entry_price * (1 - params['sl_percent'])
-            )
-        else:
-            raw_price = (
-                entry_price * (1 - params['tp_percent'])
-                if exit_type == 'TP'
-                else entry_price * (1 + params['sl_percent'])
-            )
+        tp_price, sl_price = self.coin_managers[coin].exit_prices(side, entry_price)
+        raw_price = tp_price if exit_type == 'TP' else sl_price
         return self.format_price(coin, raw_price)
 
     def fetch_open_conditional_orders(self, coin):
@@ -1229,6 +1534,7 @@ class TradingBot:
             coin = raw_position.get('symbol')
             if coin not in ACTIVE_COINS:
                 continue
+            coin = sys.intern(coin)
 
             try:
                 amount = float(raw_position.get('positionAmt', 0))
@@ -1254,23 +1560,23 @@ class TradingBot:
             tp_price = tp_stop_price or self.derive_expected_exit_price(coin, side, 'TP', entry_price)
             sl_price = sl_stop_price or self.derive_expected_exit_price(coin, side, 'SL', entry_price)
 
-            restored_data = {
-                'side': side,
-                'entry_price': entry_price,
-                'quantity': quantity,
-                'entry_time': datetime.now(),
-                'entry_order_id': f"restored:{coin}:{int(time.time())}",
-                'tp_order_id': tp_order_ref,
-                'sl_order_id': sl_order_ref,
-                'tp_price': tp_price,
-                'sl_price': sl_price,
-                'restored_from_exchange': True,
-                'protection_reconciled': bool(tp_order_ref and sl_order_ref),
-            }
+            restored_data = Position(
+                side=side,
+                entry_price=entry_price,
+                quantity=quantity,
+                entry_time=datetime.now(),
+                entry_order_id=f"restored:{coin}:{int(time.time())}",
+                tp_order_id=tp_order_ref,
+                sl_order_id=sl_order_ref,
+                tp_price=tp_price,
+                sl_price=sl_price,
+                restored_from_exchange=True,
+                protection_reconciled=bool(tp_order_ref and sl_order_ref),
+            )
             self.position_tracker.restore_position(coin, restored_data)
             restored_count += 1
 
-            if not restored_data['protection_reconciled']:
+            if not restored_data.protection_reconciled:
                 missing_protection_count += 1
                 logger.warning(
                     f"⚠️ {coin} was restored without both TP/SL orders. "
@@ -1388,21 +1694,19 @@ class TradingBot:
                 return False
                 
             # Cancel existing TP/SL orders first
-            self.cancel_order_safe(coin, position.get('tp_order_id'), conditional=True)
-            self.cancel_order_safe(coin, position.get('sl_order_id'), conditional=True)
+            self.cancel_protection_orders(coin, position)
             
             # Get current price for PnL calculation
-            ticker = self.client.futures_symbol_ticker(symbol=coin)
-            current_price = float(ticker['price'])
+            current_price = self.get_current_price(coin)
             
             if not PAPER_TRADING:
                 # Place market order to close position
-                quantity = position['quantity']
+                quantity = position.quantity
                 formatted_quantity = self.format_quantity(coin, quantity)
                 if not formatted_quantity:
                     logger.error(f"❌ Failed to format close quantity for {coin}: {quantity}")
                     return False
-                if position['side'] == 'LONG':
+                if position.side == 'LONG':
                     # Close LONG by selling
                     self.client.futures_create_order(
                         symbol=coin,
@@ -1428,22 +1732,33 @@ class TradingBot:
             return False
     
     def place_entry_with_tp_sl(self, coin, side, quantity, entry_price):
-        """Place entry order with TP and SL orders"""
+        """Place entry order with TP and SL orders.
+
+        Returns (entry_ref, tp_ref, sl_ref, tp_price, sl_price), prices floored to the tick.
+        """
         try:
             manager = self.coin_managers[coin]
-            params = manager.params['parameters']
+            
+            # Calculate TP and SL prices, floored once; the float is for logs and
+            # position tracking, the string goes to the exchange
+            tp_price, sl_price = manager.exit_prices('LONG' if side == 'BUY' else 'SHORT', entry_price)
+            tp_decimal = self.normalize_price(coin, tp_price)
+            sl_decimal = self.normalize_price(coin, sl_price)
+            tp_price, tp_price_param = float(tp_decimal), self.format_exchange_decimal(tp_decimal)
+            sl_price, sl_price_param = float(sl_decimal), self.format_exchange_decimal(sl_decimal)
             
             # Place market entry order
             if PAPER_TRADING:
-                logger.info(f"📝 PAPER TRADE: {side} {quantity} {coin} @ ${entry_price:.2f}")
-                entry_order_ref = f"paper:entry:{time.time()}"
-                tp_order_ref = f"paper:tp:{time.time()}"
-                sl_order_ref = f"paper:sl:{time.time()}"
+                logger.info("📝 PAPER TRADE: %s %s %s @ $%.2f", side, quantity, coin, entry_price)
+                paper_ref = time.monotonic_ns()
+                entry_order_ref = f"paper:entry:{paper_ref}"
+                tp_order_ref = f"paper:tp:{paper_ref}"
+                sl_order_ref = f"paper:sl:{paper_ref}"
             else:
                 formatted_quantity = self.format_quantity(coin, quantity)
                 if not formatted_quantity:
                     logger.error(f"❌ Invalid formatted quantity for {coin}: {quantity}")
-                    return None, None, None
+                    return None, None, None, None, None
 
                 # Place real entry order
                 if side == 'BUY':
@@ -1461,81 +1776,59 @@ class TradingBot:
                         quantity=formatted_quantity
                     )
                 
-                logger.info(f"✅ Entry order placed: {side} {quantity} {coin}")
+                logger.info("✅ Entry order placed: %s %s %s", side, quantity, coin)
                 entry_order_ref = self.seed_order_cache(coin, entry_order)
                 if not entry_order_ref:
                     logger.error(f"❌ Entry order response missing identifiers for {coin}: {entry_order}")
-                    return None, None, None
-                
-                # Calculate TP and SL prices
-                if side == 'BUY':  # LONG position
-                    tp_price = entry_price * (1 + params['tp_percent'])
-                    sl_price = entry_price * (1 - params['sl_percent'])
-                    exit_side = 'SELL'
-                else:  # SHORT position
-                    tp_price = entry_price * (1 - params['tp_percent'])
-                    sl_price = entry_price * (1 + params['sl_percent'])
-                    exit_side = 'BUY'
-                
-                # Format prices according to tick size
-                tp_price = self.format_price(coin, tp_price)
-                sl_price = self.format_price(coin, sl_price)
-                tp_price_param = self.format_price_param(coin, tp_price)
-                sl_price_param = self.format_price_param(coin, sl_price)
+                    return None, None, None, None, None
                 
-                logger.info(f"📊 Setting TP @ ${tp_price:.2f} (+{params['tp_percent']*100:.2f}%)")
-                logger.info(f"📊 Setting SL @ ${sl_price:.2f} (-{params['sl_percent']*100:.2f}%)")
+                exit_side = 'SELL' if side == 'BUY' else 'BUY'
                 
-                # Place TP order
-                try:
-                    tp_order = self.client.futures_create_order(
-                        symbol=coin,
-                        side=exit_side,
-                        type='TAKE_PROFIT_MARKET',
-                        stopPrice=tp_price_param,
-                        quantity=formatted_quantity,
-                        reduceOnly=True,
-                        workingType='MARK_PRICE'
-                    )
-                    tp_order_ref = self.seed_order_cache(coin, tp_order)
-                    if tp_order_ref:
-                        logger.info(f"✅ TP order placed: {format_order_reference(tp_order_ref)}")
-                    else:
-                        logger.error(f"❌ TP order response missing identifiers for {coin}: {tp_order}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to place TP order: {e}")
-                    tp_order_ref = None
+                logger.info("📊 Setting TP @ $%.2f (+%.2f%%)", tp_price, manager.tp_percent * 100)
+                logger.info("📊 Setting SL @ $%.2f (-%.2f%%)", sl_price, manager.sl_percent * 100)
                 
-                # Place SL order
-                try:
-                    sl_order = self.client.futures_create_order(
-                        symbol=coin,
-                        side=exit_side,
-                        type='STOP_MARKET',
-                        stopPrice=sl_price_param,
-                        quantity=formatted_quantity,
-                        reduceOnly=True,
-                        workingType='MARK_PRICE'
-                    )
-                    sl_order_ref = self.seed_order_cache(coin, sl_order)
-                    if sl_order_ref:
-                        logger.info(f"✅ SL order placed: {format_order_reference(sl_order_ref)}")
-                    else:
-                        logger.error(f"❌ SL order response missing identifiers for {coin}: {sl_order}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to place SL order: {e}")
-                    sl_order_ref = None
+                # TP and SL go out together; each is its own algo-order request
+                tp_future = self.order_executor.submit(
+                    self.place_protection_order, coin, 'TP', 'TAKE_PROFIT_MARKET',
+                    exit_side, tp_price_param, formatted_quantity
+                )
+                sl_order_ref = self.place_protection_order(
+                    coin, 'SL', 'STOP_MARKET', exit_side, sl_price_param, formatted_quantity
+                )
+                tp_order_ref = tp_future.result()
 
                 notifier.send_trade_alert(coin, side, entry_price)
                 # Discord disabled for now
                 # if DISCORD_AVAILABLE:
                 #     discord.send_trade_alert(coin, side, entry_price,tp_price,sl_price)
             
-            return entry_order_ref, tp_order_ref, sl_order_ref
+            return entry_order_ref, tp_order_ref, sl_order_ref, tp_price, sl_price
             
         except Exception as e:
             logger.error(f"❌ Failed to place orders for {coin}: {e}")
-            return None, None, None
+            return None, None, None, None, None
+    
+    def place_protection_order(self, coin, label, order_type, exit_side, stop_price_param, formatted_quantity):
+        """Place one reduce-only TP/SL order; returns its order reference or None"""
+        try:
+            order = self.client.futures_create_order(
+                symbol=coin,
+                side=exit_side,
+                type=order_type,
+                stopPrice=stop_price_param,
+                quantity=formatted_quantity,
+                reduceOnly=True,
+                workingType='MARK_PRICE'
+            )
+            order_ref = self.seed_order_cache(coin, order)
+            if order_ref:
+                logger.info(f"✅ {label} order placed: {format_order_reference(order_ref)}")
+            else:
+                logger.error(f"❌ {label} order response missing identifiers for {coin}: {order}")
+            return order_ref
+        except Exception as e:
+            logger.error(f"❌ Failed to place {label} order: {e}")
+            return None
     
     def cancel_order_safe(self, coin, order_id, conditional=False):
         """Safely cancel an order"""
@@ -1557,6 +1850,26 @@ class TradingBot:
             logger.error(f"❌ Failed to cancel order {format_order_reference(order_id)}: {e}")
             return False
     
+    def cancel_protection_orders(self, coin, position):
+        """Cancel a position's TP and SL by id, concurrently; cancel-all only when an id is unknown"""
+        if PAPER_TRADING or (position.tp_order_id and position.sl_order_id):
+            # Only the tracked ids, so algo orders placed by hand on the symbol survive
+            tp_cancel = self.order_executor.submit(
+                self.cancel_order_safe, coin, position.tp_order_id, conditional=True
+            )
+            self.cancel_order_safe(coin, position.sl_order_id, conditional=True)
+            tp_cancel.result()
+            return
+
+        try:
+            # A restored position may not know its TP/SL ids; sweep the symbol's algo orders
+            self.client.futures_cancel_all_algo_open_orders(symbol=coin)
+            logger.info(f"✅ Cancelled TP/SL orders for {coin}")
+        except Exception as e:
+            logger.warning(f"⚠️ Cancel-all failed for {coin} ({e}); cancelling TP/SL individually")
+            self.cancel_order_safe(coin, position.tp_order_id, conditional=True)
+            self.cancel_order_safe(coin, position.sl_order_id, conditional=True)
+    
     def check_order_status(self, coin, order_id, conditional=False):
         """Check if an order is filled"""
         if not order_id:
@@ -1609,79 +1922,84 @@ class TradingBot:
             manager = self.coin_managers[coin]
 
             with manager.data_lock:
-                if manager.entry_df is None or manager.trend_df is None:
+                if len(manager.entry_candles) < 2 or len(manager.trend_candles) < 2:
                     return
-                entry_df = manager.entry_df.copy()
-                trend_df = manager.trend_df.copy()
-
-            if len(entry_df) < 2 or len(trend_df) < 2:
-                return
+                entry_df = manager.entry_candles.to_frame()
+                trend_df = manager.trend_candles.to_frame()
             
             # Calculate indicators on buffered data that is updated by WebSocket closes.
-            entry_df = manager.indicator_calc.calculate_all_indicators(entry_df)
-            trend_df = manager.indicator_calc.calculate_all_indicators(trend_df)
-            
-            # Get current position
-            position = self.position_tracker.get_position(coin)
+            # Cached per timeframe, so the trend frame is only recomputed when one of its candles closes
+            entry_df = manager.indicator_calc.calculate_all_indicators(entry_df, manager.entry_timeframe)
+            trend_df = manager.indicator_calc.calculate_all_indicators(trend_df, manager.trend_timeframe)
             
-            # Skip if we already have a position (no reversal logic)
-            if position:
+            with self.entry_lock:
+                self.decide_on_candle_close(coin, manager, entry_df, trend_df, execution_price)
+                    
+        except Exception as e:
+            logger.error(f"Error checking signal for {coin}: {e}")
+    
+    def decide_on_candle_close(self, coin, manager, entry_df, trend_df, execution_price):
+        """Execute the pending signal or queue a new one; callers hold entry_lock."""
+        # Get current position
+        position = self.position_tracker.get_position(coin)
+        
+        # Skip if we already have a position (no reversal logic)
+        if position:
+            return
+        
+        # STEP 1: Execute pending signal if exists (from previous candle)
+        pending = self.pending_signals.get(coin)
+        if pending is not None:
+            signal = pending['signal']
+            strength = pending['strength']
+            filters = pending['filters']
+
+            if not self.is_signal_allowed_by_spy(coin, signal, "pending entry"):
+                self.pending_signals[coin] = None
                 return
             
-            # STEP 1: Execute pending signal if exists (from previous candle)
-            if coin in self.pending_signals:
-                pending = self.pending_signals[coin]
-                signal = pending['signal']
-                strength = pending['strength']
-                filters = pending['filters']
-
-                if not self.is_signal_allowed_by_spy(coin, signal, "pending entry"):
-                    del self.pending_signals[coin]
-                    return
+            # Check balance and position limits
+            if self.account_balance >= MARGIN_PER_TRADE and \
+               self.position_tracker.total_positions() < MAX_TOTAL_POSITIONS:
                 
-                # Check balance and position limits
-                if self.account_balance >= MARGIN_PER_TRADE and \
-                   self.position_tracker.total_positions() < MAX_TOTAL_POSITIONS:
-                    
-                    # Use the closed candle price delivered by the WebSocket event instead of a fresh REST ticker call.
-                    market_price = execution_price if execution_price is not None else float(entry_df.iloc[-1]['close'])
-                    
-                    logger.info(f"⏰ {coin} Executing PENDING signal: {signal} @ MARKET ${market_price:.2f} (Strength: {strength:.2f})")
-                    
-                    # Log active filters
+                # Use the closed candle price delivered by the WebSocket event instead of a fresh REST ticker call.
+                market_price = execution_price if execution_price is not None else float(entry_df.iloc[-1]['close'])
+                
+                logger.info("⏰ %s Executing PENDING signal: %s @ MARKET $%.2f (Strength: %.2f)", coin, signal, market_price, strength)
+                
+                # Log active filters (only built when INFO is on)
+                if logger.isEnabledFor(logging.INFO):
                     active_filters = [f"{k}:{v['signal']:.2f}" for k, v in filters.items() if abs(v['signal']) > 0.1]
                     if active_filters:
-                        logger.info(f"   Active filters: {', '.join(active_filters[:5])}")
-                    
-                    self.enter_new_position(coin, signal, market_price)
+                        logger.info("   Active filters: %s", ', '.join(active_filters[:5]))
                 
-                # Clear pending signal after execution attempt
-                del self.pending_signals[coin]
-                return  # Don't calculate new signal in same iteration
-            
-            # STEP 2: No position and no pending - check for new entry signal
-            # Use DELAYED signal calculation (previous candle data)
-            signal, strength, filters = manager.indicator_calc.get_entry_signal_delayed(entry_df, trend_df)
+                self.enter_new_position(coin, signal, market_price)
             
-            if signal:
-                if not self.is_signal_allowed_by_spy(coin, signal, "new signal"):
-                    return
+            # Clear pending signal after execution attempt
+            self.pending_signals[coin] = None
+            return  # Don't calculate new signal in same iteration
+        
+        # STEP 2: No position and no pending - check for new entry signal
+        # Use DELAYED signal calculation (previous candle data)
+        signal, strength, filters = manager.indicator_calc.get_entry_signal_delayed(entry_df, trend_df)
+        
+        if signal:
+            if not self.is_signal_allowed_by_spy(coin, signal, "new signal"):
+                return
 
-                # Store as pending signal for execution on NEXT candle close
-                self.pending_signals[coin] = {
-                    'signal': signal,
-                    'strength': strength,
-                    'filters': filters
-                }
-                logger.info(f"📌 {coin} NEW signal detected: {signal} (Strength: {strength:.2f}) - PENDING for next candle")
-                
-                # Log active filters
+            # Store as pending signal for execution on NEXT candle close
+            self.pending_signals[coin] = {
+                'signal': signal,
+                'strength': strength,
+                'filters': filters
+            }
+            logger.info("📌 %s NEW signal detected: %s (Strength: %.2f) - PENDING for next candle", coin, signal, strength)
+            
+            # Log active filters (only built when INFO is on)
+            if logger.isEnabledFor(logging.INFO):
                 active_filters = [f"{k}:{v['signal']:.2f}" for k, v in filters.items() if abs(v['signal']) > 0.1]
                 if active_filters:
-                    logger.info(f"   Pending filters: {', '.join(active_filters[:5])}")
-                    
-        except Exception as e:
-            logger.error(f"Error checking signal for {coin}: {e}")
+                    logger.info("   Pending filters: %s", ', '.join(active_filters[:5]))
     
     def enter_new_position(self, coin, signal, entry_price):
         """
@@ -1699,7 +2017,7 @@ class TradingBot:
             if quantity:
                 # Place entry with TP/SL orders
                 side = 'BUY' if signal == 'LONG' else 'SELL'
-                entry_order_ref, tp_order_ref, sl_order_ref = self.place_entry_with_tp_sl(
+                entry_order_ref, tp_order_ref, sl_order_ref, tp_price, sl_price = self.place_entry_with_tp_sl(
                     coin, side, quantity, entry_price
                 )
                 
@@ -1723,20 +2041,18 @@ class TradingBot:
                             logger.error(f"❌ Failed to close unprotected {coin} entry: {protection_error}")
                         return
 
-                    # Track position with all order IDs
-                    self.position_tracker.add_position(coin, {
-                        'side': signal,
-                        'entry_price': entry_price,
-                        'quantity': quantity,
-                        'entry_time': datetime.now(),
-                        'entry_order_id': entry_order_ref,
-                        'tp_order_id': tp_order_ref,
-                        'sl_order_id': sl_order_ref,
-                        'tp_price': entry_price * (1 + manager.params['parameters']['tp_percent']) if signal == 'LONG' else entry_price * (1 - manager.params['parameters']['tp_percent']),
-                        'sl_price': entry_price * (1 - manager.params['parameters']['sl_percent']) if signal == 'LONG' else entry_price * (1 + manager.params['parameters']['sl_percent'])
-                             
-                        
-                    })
+                    # Track position with all order IDs and the TP/SL prices actually placed
+                    self.position_tracker.add_position(coin, Position(
+                        side=signal,
+                        entry_price=entry_price,
+                        quantity=quantity,
+                        entry_time=datetime.now(),
+                        entry_order_id=entry_order_ref,
+                        tp_order_id=tp_order_ref,
+                        sl_order_id=sl_order_ref,
+                        tp_price=tp_price,
+                        sl_price=sl_price
+                    ))
                                         # COPY-TRADE ADDON (ENTRY) - ADD ONLY
                     try:
                         copy_side = 'BUY' if signal == 'LONG' else 'SELL'
@@ -1765,49 +2081,48 @@ class TradingBot:
             manager = self.coin_managers[coin]
             
             # Check TP order status
-            tp_status = self.check_order_status(coin, position.get('tp_order_id'), conditional=True)
-            sl_status = self.check_order_status(coin, position.get('sl_order_id'), conditional=True)
+            tp_status = self.check_order_status(coin, position.tp_order_id, conditional=True)
+            sl_status = self.check_order_status(coin, position.sl_order_id, conditional=True)
             
             # If in paper trading mode, check prices manually
             if PAPER_TRADING:
-                ticker = self.client.futures_symbol_ticker(symbol=coin)
-                current_price = float(ticker['price'])
+                current_price = self.get_current_price(coin)
                 
-                if position['side'] == 'LONG':
-                    if current_price >= position['tp_price']:
-                        logger.info(f"📊 {coin} TP Hit (Paper): ${current_price:.2f}")
+                if position.side == 'LONG':
+                    if current_price >= position.tp_price:
+                        logger.info("📊 %s TP Hit (Paper): $%.2f", coin, current_price)
                         self.handle_exit(coin, 'TP', current_price)
                         return 'TP'
-                    elif current_price <= position['sl_price']:
-                        logger.info(f"📊 {coin} SL Hit (Paper): ${current_price:.2f}")
+                    elif current_price <= position.sl_price:
+                        logger.info("📊 %s SL Hit (Paper): $%.2f", coin, current_price)
                         self.handle_exit(coin, 'SL', current_price)
                         return 'SL'
                 else:  # SHORT
-                    if current_price <= position['tp_price']:
-                        logger.info(f"📊 {coin} TP Hit (Paper): ${current_price:.2f}")
+                    if current_price <= position.tp_price:
+                        logger.info("📊 %s TP Hit (Paper): $%.2f", coin, current_price)
                         self.handle_exit(coin, 'TP', current_price)
                         return 'TP'
-                    elif current_price >= position['sl_price']:
-                        logger.info(f"📊 {coin} SL Hit (Paper): ${current_price:.2f}")
+                    elif current_price >= position.sl_price:
+                        logger.info("📊 %s SL Hit (Paper): $%.2f", coin, current_price)
                         self.handle_exit(coin, 'SL', current_price)
                         return 'SL'
             
             # Check if TP filled
             if tp_status == 'FILLED':
-                logger.info(f"📊 {coin} TP Order Filled!")
+                logger.info("📊 %s TP Order Filled!", coin)
                 # Cancel SL order
-                self.cancel_order_safe(coin, position.get('sl_order_id'), conditional=True)
+                self.cancel_order_safe(coin, position.sl_order_id, conditional=True)
                 # Handle exit
-                self.handle_exit(coin, 'TP', position['tp_price'])
+                self.handle_exit(coin, 'TP', position.tp_price)
                 return 'TP'
             
             # Check if SL filled
             if sl_status == 'FILLED':
-                logger.info(f"📊 {coin} SL Order Filled!")
+                logger.info("📊 %s SL Order Filled!", coin)
                 # Cancel TP order
-                self.cancel_order_safe(coin, position.get('tp_order_id'), conditional=True)
+                self.cancel_order_safe(coin, position.tp_order_id, conditional=True)
                 # Handle exit
-                self.handle_exit(coin, 'SL', position['sl_price'])
+                self.handle_exit(coin, 'SL', position.sl_price)
                 return 'SL'
             
             # Check if both orders somehow disappeared (wait longer on testnet)
@@ -1823,25 +2138,24 @@ class TradingBot:
                     return None
 
                 # On testnet, give orders more time to appear (testnet is slower)
-                position_age = (datetime.now() - position.get('entry_time', datetime.now())).total_seconds()
+                position_age = (time.monotonic_ns() - position.entry_mono_ns) / 1e9
                 if position_age < 90:  # Give exchange-side TP/SL and websocket reconciliation time before panicking.
                     return None  # Don't close yet, orders might still be syncing
                 
                 try:
                     # Try to get current price first
-                    ticker = self.client.futures_symbol_ticker(symbol=coin)
-                    current_price = float(ticker['price'])
+                    current_price = self.get_current_price(coin)
                     
                     # Only proceed if we successfully got price
                     logger.warning(f"⚠️ Both orders missing for {coin} after 90s with no private-stream confirmation! Closing position manually")
                     
                     # Place market order to close
-                    quantity = position['quantity']
+                    quantity = position.quantity
                     formatted_quantity = self.format_quantity(coin, quantity)
                     if not formatted_quantity:
                         logger.error(f"❌ Invalid formatted manual-close quantity for {coin}: {quantity}")
                         return None
-                    if position['side'] == 'LONG':
+                    if position.side == 'LONG':
                         self.client.futures_create_order(
                             symbol=coin,
                             side='SELL',
@@ -1877,26 +2191,38 @@ class TradingBot:
                 return
             
             # Calculate PnL
-            entry_price = position['entry_price']
-            if position['side'] == 'LONG':
+            entry_price = position.entry_price
+            if position.side == 'LONG':
                 pnl_pct = ((exit_price - entry_price) / entry_price) * 100
             else:
                 pnl_pct = ((entry_price - exit_price) / entry_price) * 100
             
             pnl_value = (pnl_pct / 100) * MARGIN_PER_TRADE
             
-            logger.info(f"💰 {coin} Closed: {exit_type} @ ${exit_price:.2f} | PnL: {pnl_pct:.2f}% (${pnl_value:.2f})")
+            logger.info("💰 %s Closed: %s @ $%.2f | PnL: %.2f%% ($%.2f)", coin, exit_type, exit_price, pnl_pct, pnl_value)
+
+                        # COPY-TRADE ADDON (EXIT) - ADD ONLY
+            try:
+                close_side = 'SELL' if position.side == 'LONG' else 'BUY'
+                copy_results = copy_close_to_followers(
+                    symbol=coin,
+                    side=close_side,
+                    quantity=position.quantity
+                )
+                ok_count = sum(1 for r in copy_results if r.get("ok"))
+                fail_count = len(copy_results) - ok_count
+                logger.info("📋 Copy EXIT %s: success=%d, failed=%d", coin, ok_count, fail_count)
+            except Exception as copy_err:
+                logger.error(f"❌ Copy EXIT failed for {coin}: {copy_err}")
 
-            # Send notifications
-            notifier.send_exit_alert(coin, exit_type, pnl_pct, pnl_value)
-            # Discord disabled for now
-            # if DISCORD_AVAILABLE:
-            #     discord.send_exit_alert(coin, exit_type, pnl_pct, pnl_value)
             
-            # Prepare trade data
-            trade_data = {
+            # Remove position
+            self.position_tracker.remove_position(coin)
+
+            # Notifications, DB, stats and the balance refresh run on the post-exit worker
+            self.post_exit_executor.submit(self.record_exit, {
                 'coin': coin,
-                'side': position['side'],
+                'side': position.side,
                 'entry_price': entry_price,
                 'exit_price': exit_price,
                 'pnl_pct': pnl_pct,
@@ -1904,7 +2230,20 @@ class TradingBot:
                 'exit_type': exit_type,
                 'position_size': POSITION_VALUE,
                 'leverage': LEVERAGE
-            }
+            })
+            
+        except Exception as e:
+            logger.error(f"Error handling exit for {coin}: {e}")
+
+    def record_exit(self, trade_data):
+        """Slow half of an exit: alerts, trade history, stats and (without a live user stream) balance refresh"""
+        try:
+            coin = trade_data['coin']
+            # Send notifications
+            notifier.send_exit_alert(coin, trade_data['exit_type'], trade_data['pnl_pct'], trade_data['pnl_value'])
+            # Discord disabled for now
+            # if DISCORD_AVAILABLE:
+            #     discord.send_exit_alert(coin, exit_type, pnl_pct, pnl_value)
             
             # Save trade to database
             save_trade_to_db(trade_data)
@@ -1915,35 +2254,21 @@ class TradingBot:
             # Send detailed stats notification
             detailed_msg = enhanced_stats.format_trade_close_message(trade_data)
             notifier.send_message(detailed_msg)
-
-                        # COPY-TRADE ADDON (EXIT) - ADD ONLY
-            try:
-                close_side = 'SELL' if position['side'] == 'LONG' else 'BUY'
-                copy_results = copy_close_to_followers(
-                    symbol=coin,
-                    side=close_side,
-                    quantity=position['quantity']
-                )
-                ok_count = sum(1 for r in copy_results if r.get("ok"))
-                fail_count = len(copy_results) - ok_count
-                logger.info(f"📋 Copy EXIT {coin}: success={ok_count}, failed={fail_count}")
-            except Exception as copy_err:
-                logger.error(f"❌ Copy EXIT failed for {coin}: {copy_err}")
-
             
-            # Remove position
-            self.position_tracker.remove_position(coin)
-            
-            # Update balance
-            self.check_account(fatal=False)
+            # ACCOUNT_UPDATE on the user stream already carries the new balance
+            if not self.user_stream_healthy():
+                self.check_account(fatal=False)
             
         except Exception as e:
-            logger.error(f"Error handling exit for {coin}: {e}")
+            logger.error(f"Error recording exit for {trade_data.get('coin')}: {e}")
 
     def reconcile_exit_fill_from_user_stream(self, order):
         """Close tracked positions immediately when a protective exit fill arrives on the private stream."""
         try:
             symbol = order.get('s')
+            if not symbol:
+                return False
+            symbol = sys.intern(symbol)
             position = self.position_tracker.get_position(symbol)
             if not position:
                 return False
@@ -1953,7 +2278,7 @@ class TradingBot:
                 return False
 
             order_side = str(order.get('S') or '').upper()
-            expected_exit_side = 'SELL' if position['side'] == 'LONG' else 'BUY'
+            expected_exit_side = 'SELL' if position.side == 'LONG' else 'BUY'
             if order_side != expected_exit_side:
                 return False
 
@@ -1973,8 +2298,8 @@ class TradingBot:
             ):
                 return False
 
-            tp_order_ref = position.get('tp_order_id')
-            sl_order_ref = position.get('sl_order_id')
+            tp_order_ref = position.tp_order_id
+            sl_order_ref = position.sl_order_id
 
             if tp_order_ref and self.order_matches_reference(tp_order_ref, order):
                 exit_type = 'TP'
@@ -1994,8 +2319,8 @@ class TradingBot:
                     trigger_price = None
 
                 if trigger_price is not None:
-                    tp_distance = abs(trigger_price - float(position.get('tp_price', trigger_price)))
-                    sl_distance = abs(trigger_price - float(position.get('sl_price', trigger_price)))
+                    tp_distance = abs(trigger_price - float(position.tp_price))
+                    sl_distance = abs(trigger_price - float(position.sl_price))
                     exit_type = 'TP' if tp_distance <= sl_distance else 'SL'
                 else:
                     exit_type = 'MANUAL'
@@ -2012,16 +2337,16 @@ class TradingBot:
 
             if exit_price is None or exit_price <= 0:
                 if exit_type == 'TP':
-                    exit_price = float(position.get('tp_price', position['entry_price']))
+                    exit_price = float(position.tp_price)
                 elif exit_type == 'SL':
-                    exit_price = float(position.get('sl_price', position['entry_price']))
+                    exit_price = float(position.sl_price)
                 else:
-                    exit_price = float(position['entry_price'])
+                    exit_price = float(position.entry_price)
 
             sibling_order_ref = (
-                position.get('sl_order_id')
+                position.sl_order_id
                 if exit_type == 'TP'
-                else position.get('tp_order_id')
+                else position.tp_order_id
             )
             if exit_type in {'TP', 'SL'} and sibling_order_ref:
                 self.cancel_order_safe(symbol, sibling_order_ref, conditional=True)
@@ -2063,21 +2388,48 @@ class TradingBot:
         self.ws_streams.append(self.user_stream_name)
         logger.info("✅ Futures user-data stream active for order/account reconciliation")
 
+        pairs = self.start_market_socket()
+        logger.info("✅ WebSocket market streams active for %s symbol/timeframe pairs", pairs)
+
+    def start_market_socket(self):
+        """Open the combined kline + ticker socket; returns the number of kline streams."""
+        # Every kline and ticker stream shares one combined connection instead of
+        # a socket per (coin, timeframe); same continuous-kline payloads as before
         started = set()
+        streams = []
         for coin, manager in self.coin_managers.items():
-            for timeframe in {manager.entry_timeframe, manager.trend_timeframe}:
+            for timeframe in (manager.entry_timeframe, manager.trend_timeframe):
                 stream_key = (coin, timeframe)
                 if stream_key in started:
                     continue
-                stream_name = self.ws_manager.start_kline_futures_socket(
-                    callback=self.handle_kline_message,
-                    symbol=coin,
-                    interval=timeframe,
-                )
-                self.ws_streams.append(stream_name)
+                streams.append(f"{coin.lower()}_perpetual@continuousKline_{timeframe}")
                 started.add(stream_key)
+            streams.append(f"{coin.lower()}@ticker")
+
+        self.market_stream_last_message_at = time.time()
+        self.market_stream_name = self.ws_manager.start_futures_multiplex_socket(
+            callback=self.handle_market_message,
+            streams=streams,
+        )
+        self.ws_streams.append(self.market_stream_name)
+        return len(started)
 
-        logger.info("✅ WebSocket market streams active for %s symbol/timeframe pairs", len(started))
+    def restart_market_socket_if_silent(self, now):
+        """Reopen the market socket when it has gone quiet (dropped past its own reconnects)."""
+        if self.ws_manager is None or self.market_stream_name is None:
+            return
+        silent_for = now - self.market_stream_last_message_at
+        if silent_for < MARKET_STREAM_SILENCE_SECONDS:
+            return
+        logger.warning("⚠️ No market stream data for %.0fs, reconnecting", silent_for)
+        try:
+            self.ws_manager.stop_socket(self.market_stream_name)
+        except Exception as exc:
+            logger.warning(f"⚠️ Failed to stop market stream cleanly: {exc}")
+        if self.market_stream_name in self.ws_streams:
+            self.ws_streams.remove(self.market_stream_name)
+        # Missed closes are backfilled by the gap check on the next candle
+        self.start_market_socket()
 
     def handle_user_stream_message(self, msg):
         """Track order/account updates from the futures private stream before falling back to REST."""
@@ -2116,7 +2468,7 @@ class TradingBot:
                 for reference in references:
                     self.user_order_cache[reference] = cache_payload
 
-                if order_status in {'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'}:
+                if order_status in TERMINAL_ORDER_STATUSES:
                     display_ref = references[0] if references else order_id
                     logger.info(f"📨 {symbol} order update {format_order_reference(display_ref)}: {order_status}")
                     if order_status == 'FILLED':
@@ -2134,6 +2486,38 @@ class TradingBot:
         except Exception as exc:
             logger.error(f"Error handling user stream message: {exc}")
 
+    def handle_market_message(self, msg):
+        """Route combined-stream payloads to the kline / ticker handlers."""
+        if not isinstance(msg, dict):
+            return
+        data = msg.get('data', msg)
+        event_type = data.get('e') if isinstance(data, dict) else None
+        if event_type != 'error':
+            self.market_stream_last_message_at = time.time()
+        if event_type == '24hrTicker':
+            self.handle_ticker_message(data)
+        else:
+            self.handle_kline_message(data)
+
+    def handle_ticker_message(self, msg):
+        """Keep the latest traded price per symbol from the futures ticker streams."""
+        try:
+            if not isinstance(msg, dict) or msg.get('e') != '24hrTicker':
+                return
+            coin = msg.get('s')
+            if coin in self.coin_managers:
+                self.live_prices[sys.intern(coin)] = (float(msg['c']), time.time())
+        except Exception as exc:
+            logger.error(f"Error handling ticker message: {exc}")
+
+    def get_current_price(self, coin):
+        """Latest traded price: the streamed one while fresh, otherwise a REST ticker call."""
+        cached = self.live_prices.get(coin)
+        if cached is not None and time.time() - cached[1] < LIVE_PRICE_MAX_AGE_SECONDS:
+            return cached[0]
+        ticker = self.client.futures_symbol_ticker(symbol=coin)
+        return float(ticker['price'])
+
     def handle_kline_message(self, msg):
         """Handle futures kline messages from WebSocket streams."""
         try:
@@ -2152,20 +2536,35 @@ class TradingBot:
             timeframe = kline.get('i')
             if not coin or not timeframe or coin not in self.coin_managers:
                 return
+            # Same object as the ACTIVE_COINS key, so per-coin dict lookups hit on identity
+            coin = sys.intern(coin)
 
             candle_time = kline.get('t')
             close_price = float(kline.get('c', 0))
             manager = self.coin_managers[coin]
 
-            if self.last_candles[coin].get(timeframe) == candle_time:
+            previous_time = self.last_candles[coin].get(timeframe)
+            if previous_time == candle_time:
                 return
 
             self.last_candles[coin][timeframe] = candle_time
+            if previous_time is not None and candle_time - previous_time > TIMEFRAME_MS.get(timeframe, candle_time):
+                # Closes were missed (e.g. while the socket reconnected); refill from REST
+                self.resync_candle_buffer(coin, timeframe, candle_time)
             self.update_candle_buffers(coin, timeframe, kline)
-            logger.info(f"📊 {coin} {timeframe} candle closed at ${close_price:.2f}")
+            logger.info("📊 %s %s candle closed at $%.2f", coin, timeframe, close_price)
+
+            event_time = msg.get('E')
+            if event_time and time.time() * 1000 - event_time > KLINE_STALE_EVENT_MS:
+                # Still checked: skipping would leave a pending signal to fire a whole candle late
+                logger.warning(
+                    "⚠️ %s %s candle close arrived %.1fs late",
+                    coin, timeframe, (time.time() * 1000 - event_time) / 1000
+                )
 
             if timeframe == manager.entry_timeframe:
-                self.check_signal_on_candle_close(coin, execution_price=close_price)
+                # Off the WebSocket thread so other coins' closes are handled concurrently
+                self.signal_executor.submit(self.check_signal_on_candle_close, coin, close_price)
 
         except Exception as e:
             logger.error(f"Error handling kline message: {e}")
@@ -2173,54 +2572,83 @@ class TradingBot:
     def trading_loop(self):
         """Main trading loop - checks if TP/SL orders filled"""
         logger.info("🚀 Starting trading loop...")
-        thresholds = ", ".join([f"{coin.replace('USDC','')}={manager.params['parameters']['entry_threshold']:.3f}" 
-                               for coin, manager in self.coin_managers.items()])
-        logger.info(f"   Entry thresholds: {thresholds}")
+        logger.info("   Entry thresholds: %s", self.threshold_log)
         logger.info("⏳ Waiting for WebSocket candle-close events...")
         logger.info("📊 TP/SL orders will be placed on Binance for instant execution")
         logger.info("📊 Positions exit on TP/SL only (no reversals)")
         
         while self.running:
+            deadline = time.monotonic() + TRADING_LOOP_PERIOD_SECONDS
             try:
-                # Daily cleanup and stats check
-                current_date = datetime.now(timezone.utc).date()
-                if current_date > self.last_cleanup:
-                    cleanup_old_trades(10)  # Keep only last 10 days
-                    self.last_cleanup = current_date
-                    logger.info(f"✅ Daily cleanup completed for {current_date} UTC")
-                    
-                    # Send daily summary to Telegram
-                    daily_summary = enhanced_stats.format_daily_summary()
-                    notifier.send_message(daily_summary)
-                    logger.info("📊 Daily summary sent to Telegram (UTC midnight)")
-                    
-                    # Discord disabled for now
-                    # if DISCORD_AVAILABLE:
-                    #     summary = stats_tracker.format_daily_discord_summary()
-                    #     if summary:
-                    #         discord.send_message(summary)
-
                 self.maybe_handle_spy_bias_change()
                 self.maybe_handle_pending_spy_bias_close()
                 
-                # Check each coin for order fills
-                for coin in ACTIVE_COINS:
-                    if coin not in self.coin_managers:
-                        continue
-                    
-                    # Only check exits if position exists
-                    if self.position_tracker.has_position(coin):
-                        exit_signal = self.check_exit_conditions(coin)
-                        if exit_signal:
-                            logger.info(f"✅ {coin} position closed: {exit_signal}")
+                now = time.time()
+                if now - self.last_order_cache_prune >= ORDER_CACHE_PRUNE_INTERVAL_SECONDS:
+                    self.prune_order_cache(now)
+                self.restart_market_socket_if_silent(now)
+                if (now - self.symbol_exchange_rules_loaded_at >= EXCHANGE_RULES_REFRESH_SECONDS
+                        and not self.rest_backoff_active()):
+                    # Failed refreshes keep the old rules and retry on the next interval
+                    self.symbol_exchange_rules_loaded_at = now
+                    self.load_symbol_exchange_rules()
                 
-                # Sleep before next iteration.
-                # Binance already enforces TP/SL on-exchange, so local reconciliation does not need 5-second REST polling.
-                time.sleep(10)
+                # Check each open position for order fills; the lookups run concurrently
+                open_coins = [
+                    coin for coin in ACTIVE_COINS
+                    if coin in self.coin_managers and self.position_tracker.has_position(coin)
+                ]
+                exit_checks = [
+                    (coin, self.exit_check_executor.submit(self.check_exit_conditions, coin))
+                    for coin in open_coins
+                ]
+                for coin, future in exit_checks:
+                    exit_signal = future.result()
+                    if exit_signal:
+                        logger.info("✅ %s position closed: %s", coin, exit_signal)
                 
             except Exception as e:
-                logger.error(f"❌ Error in trading loop: {e}")
-                time.sleep(10)
+                logger.error("❌ Error in trading loop: %s", e)
+            
+            # Sleep out the rest of the period so slow passes don't stretch it
+            slack = deadline - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                logger.warning("⚠️ Trading loop pass overran by %.2fs", -slack)
+    
+    def schedule_daily_maintenance(self):
+        """Arm a one-shot timer for just after the next UTC midnight"""
+        now = datetime.now(timezone.utc)
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), timezone.utc)
+        # Half a second past midnight so the timer never fires on the old date
+        delay = (next_midnight - now).total_seconds() + 0.5
+        self.daily_maintenance_timer = threading.Timer(delay, self.run_daily_maintenance)
+        self.daily_maintenance_timer.daemon = True
+        self.daily_maintenance_timer.start()
+    
+    def run_daily_maintenance(self):
+        """Daily DB cleanup and Telegram summary, then re-arm for the next day"""
+        try:
+            current_date = datetime.now(timezone.utc).date()
+            cleanup_old_trades(TRADE_RETENTION_DAYS)
+            logger.info("✅ Daily cleanup completed for %s UTC", current_date)
+            
+            # Send daily summary to Telegram
+            daily_summary = enhanced_stats.format_daily_summary()
+            notifier.send_message(daily_summary)
+            logger.info("📊 Daily summary sent to Telegram (UTC midnight)")
+            
+            # Discord disabled for now
+            # if DISCORD_AVAILABLE:
+            #     summary = stats_tracker.format_daily_discord_summary()
+            #     if summary:
+            #         discord.send_message(summary)
+        except Exception as e:
+            logger.error("❌ Error in daily maintenance: %s", e)
+        finally:
+            if self.running:
+                self.schedule_daily_maintenance()
     
     def cleanup_open_orders(self):
         """Cancel all open TP/SL orders on shutdown"""
@@ -2229,15 +2657,9 @@ class TradingBot:
         for coin in ACTIVE_COINS:
             position = self.position_tracker.get_position(coin)
             if position:
-                # Cancel TP order
-                if position.get('tp_order_id'):
-                    self.cancel_order_safe(coin, position['tp_order_id'], conditional=True)
-                
-                # Cancel SL order
-                if position.get('sl_order_id'):
-                    self.cancel_order_safe(coin, position['sl_order_id'], conditional=True)
+                self.cancel_protection_orders(coin, position)
                 
-                logger.warning(f"⚠️ {coin} position still open at shutdown - orders cancelled")
+                logger.warning("⚠️ %s position still open at shutdown - orders cancelled", coin)
     
     def start(self):
         """Start the bot"""
@@ -2248,16 +2670,20 @@ class TradingBot:
             if PAPER_TRADING
             else ("LIVE TESTNET ORDERS" if USE_TESTNET else "LIVE MAINNET ORDERS")
         )
-        logger.info(f"   Environment: {environment_label}")
-        logger.info(f"   Execution: {execution_label}")
-        logger.info(f"   Strategy: NORMAL TP/SL EXITS - Matching optimization backtest")
-        logger.info(f"   Coins: {', '.join(ACTIVE_COINS)}")
-        logger.info(f"   Balance: ${self.account_balance:.2f} USDT")
-        logger.info(f"   TP/SL: Orders placed on Binance for instant execution")
-        logger.info(f"   Log Rotation: Max 5 files of 10MB each")
-        logger.info(f"   Database Cleanup: Keeping last 30 days of trades")
+        logger.info("   Environment: %s", environment_label)
+        logger.info("   Execution: %s", execution_label)
+        logger.info("   Strategy: NORMAL TP/SL EXITS - Matching optimization backtest")
+        logger.info("   Coins: %s", ', '.join(ACTIVE_COINS))
+        logger.info("   Balance: $%.2f USDT", self.account_balance)
+        logger.info("   TP/SL: Orders placed on Binance for instant execution")
+        logger.info("   Log Rotation: Max 5 files of 10MB each")
+        logger.info("   Database Cleanup: Keeping last %d days of trades", TRADE_RETENTION_DAYS)
         
         self.running = True
+        self.schedule_daily_maintenance()
+
+        # Compile the indicator kernels now rather than on the first candle close
+        indicators_nb.warmup()
 
         self.load_initial_candle_buffers()
         
@@ -2275,11 +2701,20 @@ class TradingBot:
         """Stop the bot"""
         logger.info("🛑 Stopping bot...")
         self.running = False
+        if self.daily_maintenance_timer is not None:
+            self.daily_maintenance_timer.cancel()
         if self.ws_manager is not None:
             try:
                 self.ws_manager.stop()
             except Exception as exc:
                 logger.warning(f"⚠️ Failed to stop WebSocket manager cleanly: {exc}")
+        self.signal_executor.shutdown(wait=False, cancel_futures=True)
+        # No cancel_futures: a TP/SL already queued should still reach the exchange
+        self.order_executor.shutdown(wait=False)
+        self.exit_check_executor.shutdown(wait=False, cancel_futures=True)
+        # Let queued exits reach save_trade_to_db before the final flush
+        self.post_exit_executor.shutdown(wait=True)
+        flush_pending_trades()
         
         # Clean up open orders
         # self.cleanup_open_orders()
@@ -2290,7 +2725,7 @@ class TradingBot:
 # SIGNAL HANDLERS
 # ========================================
 def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
+    """Handle Ctrl+C / SIGTERM gracefully"""
     logger.info("\n⚠️ Shutdown signal received...")
     if bot:
         bot.stop()
@@ -2302,6 +2737,7 @@ def signal_handler(sig, frame):
 if __name__ == "__main__":
     # Set up signal handler
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     # Create and start bot
     bot = TradingBot()
@@ -4,12 +4,31 @@ TELEGRAM NOTIFICATION MODULE
 Sends important alerts to your phone
 """
 
+import atexit
+import queue
+import threading
+import time
+
 import requests
 import logging
-from config import TELEGRAM_ENABLED, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+from config import (
+    TELEGRAM_BOT_TOKEN,
+    TELEGRAM_CHAT_ID,
+    TELEGRAM_ENABLED,
+    TELEGRAM_FLUSH_SECONDS,
+    TELEGRAM_MAX_BATCH_CHARS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Messages are queued and posted by one background thread: everything that
+# arrives within TELEGRAM_FLUSH_SECONDS goes out as one sendMessage, split at
+# message boundaries to stay under TELEGRAM_MAX_BATCH_CHARS.
+MAX_QUEUED_MESSAGES = 1000
+MAX_SEND_ATTEMPTS = 3
+# Telegram rejects longer texts outright
+MAX_MESSAGE_CHARS = 4096
+
 class TelegramNotifier:
     """Send notifications to Telegram"""
     
@@ -18,27 +37,127 @@ class TelegramNotifier:
         self.token = TELEGRAM_BOT_TOKEN
         self.chat_id = TELEGRAM_CHAT_ID
         self.base_url = f"https://api.telegram.org/bot{self.token}"
+        self._queue = queue.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        # Only the flusher thread posts, so one kept-alive connection is enough
+        self.http = requests.Session()
+        self.http.headers["Connection"] = "keep-alive"
         
         if self.enabled:
             self.send_message("🤖 Trading Bot Started on AWS!")
     
     def send_message(self, message):
-        """Send message to Telegram"""
+        """Queue a message for Telegram; returns immediately"""
         if not self.enabled:
             return
         
+        self._ensure_flusher()
         try:
-            url = f"{self.base_url}/sendMessage"
-            data = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': 'HTML'
-            }
-            response = requests.post(url, data=data, timeout=5)
-            if not response.ok:
-                logger.error(f"Telegram send failed: {response.text}")
-        except Exception as e:
-            logger.error(f"Telegram error: {e}")
+            self._queue.put_nowait(message)
+        except queue.Full:
+            logger.warning("Telegram queue full, dropping message")
+    
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far has been sent (or timeout)"""
+        if self._flusher is None:
+            return
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+    
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="telegram-flush", daemon=True)
+                self._flusher.start()
+                atexit.register(self.flush)
+    
+    def _flush_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + TELEGRAM_FLUSH_SECONDS
+            # Collect until the interval ends or a flush() marker arrives
+            while not isinstance(batch[-1], threading.Event):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            self._send_batch([item for item in batch if not isinstance(item, threading.Event)])
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+    
+    def _send_batch(self, messages):
+        pieces = [piece for message in messages for piece in self._split_message(message)]
+        for group in self._group_messages(pieces):
+            if self._post("\n\n".join(group)) == 400 and len(group) > 1:
+                # One bad message (e.g. a broken HTML entity) fails the whole batch; send each alone
+                for message in group:
+                    self._post(message)
+    
+    @staticmethod
+    def _split_message(message):
+        """Cut a message into pieces of at most MAX_MESSAGE_CHARS, at line breaks where possible"""
+        pieces = []
+        while len(message) > MAX_MESSAGE_CHARS:
+            cut = message.rfind("\n", 0, MAX_MESSAGE_CHARS)
+            if cut <= 0:
+                cut = MAX_MESSAGE_CHARS
+            pieces.append(message[:cut])
+            message = message[cut:].lstrip("\n")
+        pieces.append(message)
+        return pieces
+    
+    @staticmethod
+    def _group_messages(messages):
+        """Group queued messages so each joined group stays within TELEGRAM_MAX_BATCH_CHARS (a longer message goes alone)"""
+        groups = []
+        current = []
+        length = 0
+        for message in messages:
+            if current and length + 2 + len(message) > TELEGRAM_MAX_BATCH_CHARS:
+                groups.append(current)
+                current = []
+            length = length + 2 + len(message) if current else len(message)
+            current.append(message)
+        if current:
+            groups.append(current)
+        return groups
+    
+    def _post(self, text):
+        """Send one sendMessage; returns the HTTP status, or None if it never got a response"""
+        url = f"{self.base_url}/sendMessage"
+        data = {
+            'chat_id': self.chat_id,
+            'text': text,
+            'parse_mode': 'HTML'
+        }
+        for _ in range(MAX_SEND_ATTEMPTS):
+            try:
+                response = self.http.post(url, data=data, timeout=5)
+                if response.status_code == 429:
+                    # Rate limited: Telegram says how long to back off
+                    retry_after = response.json().get('parameters', {}).get('retry_after', 1)
+                    time.sleep(float(retry_after))
+                    continue
+                if not response.ok:
+                    logger.error(f"Telegram send failed: {response.text}")
+                return response.status_code
+            except Exception as e:
+                logger.error(f"Telegram error: {e}")
+                return None
+        logger.error("Telegram send failed: still rate-limited after retries")
+        return None
     
     def send_trade_alert(self, coin, side, price, reason="Signal"):
         """Send trade entry alert"""
@@ -0,0 +1,38 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Bot modules import each other as top-level names (from config import ...)
+BOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BOT_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# main.py reads testnet credentials at import; the tests never reach Binance
+os.environ.setdefault("BINANCE_TESTNET_API_KEY", "test-key")
+os.environ.setdefault("BINANCE_TESTNET_SECRET_KEY", "test-secret")
+
+import environment  # noqa: E402  (rewraps sys.stdout as UTF-8 on import)
+
+# Hold that wrapper: if it were collected it would close pytest's capture file
+_UTF8_STDOUT = sys.stdout
+
+PARAMETERS_DIR = BOT_DIR / "parameters"
+
+
+def make_candles(seed, n=200):
+    """Random-walk 5m OHLCV frame indexed by open time"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.r_[close[0], close[:-1]] * (1 + rng.normal(0, 0.0005, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n)))
+    volume = rng.lognormal(3, 0.5, n)
+    # int64 ms open times, like fetch_historical_data and CandleBuffer.to_frame
+    index = 1_700_000_000_000 + np.arange(n, dtype=np.int64) * 300_000
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
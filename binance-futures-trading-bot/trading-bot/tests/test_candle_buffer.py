@@ -0,0 +1,136 @@
+"""CandleBuffer storage and the kline handler's gap refill"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+import main
+from main import CandleBuffer, TradingBot
+
+STEP_MS = 300_000  # 5m candles
+T0 = 1_700_000_000_000
+
+
+def row(i):
+    return (100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0 + i)
+
+
+def fill(buffer, count):
+    for i in range(count):
+        buffer.upsert(T0 + i * STEP_MS, row(i))
+
+
+def test_wraparound_keeps_newest_capacity_rows():
+    buffer = CandleBuffer(5)
+    # Several trips past the end of the doubled storage
+    fill(buffer, 23)
+
+    frame = buffer.to_frame()
+    assert len(buffer) == 5
+    np.testing.assert_array_equal(frame.index.to_numpy(), T0 + np.arange(18, 23) * STEP_MS)
+    np.testing.assert_array_equal(frame.to_numpy(), np.array([row(i) for i in range(18, 23)]))
+
+
+def test_to_frame_is_a_snapshot():
+    buffer = CandleBuffer(3)
+    fill(buffer, 3)
+    frame = buffer.to_frame()
+    fill(buffer, 8)
+    assert frame["close"].tolist() == [row(i)[3] for i in range(3)]
+
+
+def test_upsert_replaces_and_inserts_out_of_order():
+    buffer = CandleBuffer(10)
+    for i in (0, 1, 3, 4):
+        buffer.upsert(T0 + i * STEP_MS, row(i))
+
+    # Same open time replaces the row in place
+    buffer.upsert(T0 + STEP_MS, row(50))
+    # A late candle fills the hole in order
+    buffer.upsert(T0 + 2 * STEP_MS, row(2))
+
+    frame = buffer.to_frame()
+    np.testing.assert_array_equal(frame.index.to_numpy(), T0 + np.arange(5) * STEP_MS)
+    assert frame["open"].tolist() == [row(i)[0] for i in (0, 50, 2, 3, 4)]
+
+
+def test_load_keeps_newest_rows():
+    times = T0 + np.arange(8) * STEP_MS
+    df = pd.DataFrame([row(i) for i in range(8)], columns=main.CANDLE_COLUMNS, index=times)
+    buffer = CandleBuffer(4)
+    buffer.load(df)
+    np.testing.assert_array_equal(buffer.to_frame().index.to_numpy(), times[4:])
+
+
+def make_bot(rest_frame):
+    """TradingBot with just the state handle_kline_message touches"""
+    fetches = []
+
+    def fetch_historical_data(client, timeframe, limit=200):
+        fetches.append(timeframe)
+        return rest_frame
+
+    manager = SimpleNamespace(
+        entry_timeframe="5m",
+        trend_timeframe="15m",
+        entry_candles=CandleBuffer(50),
+        trend_candles=CandleBuffer(50),
+        data_lock=threading.Lock(),
+        indicator_calc=SimpleNamespace(fetch_historical_data=fetch_historical_data),
+    )
+    bot = TradingBot.__new__(TradingBot)
+    bot.client = None
+    bot.coin_managers = {"BTCUSDT": manager}
+    bot.last_candles = {"BTCUSDT": {}}
+    bot.rest_backoff_active = lambda: False
+    bot.submitted = []
+    bot.signal_executor = SimpleNamespace(submit=lambda fn, *args: bot.submitted.append(args))
+    return bot, manager, fetches
+
+
+def close_message(i):
+    o, h, l, c, v = row(i)
+    return {
+        "e": "continuous_kline",
+        "ps": "BTCUSDT",
+        "k": {"t": T0 + i * STEP_MS, "i": "5m", "x": True, "o": o, "h": h, "l": l, "c": c, "v": v},
+    }
+
+
+def test_consecutive_closes_do_not_resync():
+    bot, manager, fetches = make_bot(rest_frame=None)
+    for i in range(3):
+        bot.handle_kline_message(close_message(i))
+
+    assert fetches == []
+    assert len(manager.entry_candles) == 3
+
+
+def test_missed_closes_are_refilled_from_rest():
+    # REST returns every candle, including one still open after the close we got
+    times = T0 + np.arange(7) * STEP_MS
+    rest_frame = pd.DataFrame([row(i) for i in range(7)], columns=main.CANDLE_COLUMNS, index=times)
+    bot, manager, fetches = make_bot(rest_frame)
+
+    bot.handle_kline_message(close_message(0))
+    bot.handle_kline_message(close_message(1))
+    # Closes 2-4 never arrived
+    bot.handle_kline_message(close_message(5))
+
+    assert fetches == ["5m"]
+    frame = manager.entry_candles.to_frame()
+    np.testing.assert_array_equal(frame.index.to_numpy(), times[:6])
+    assert frame["close"].tolist() == [row(i)[3] for i in range(6)]
+
+
+def test_late_close_still_checks_signal():
+    # A skipped check would leave the pending signal to execute a candle late
+    bot, manager, fetches = make_bot(rest_frame=None)
+    message = close_message(0)
+    message["E"] = int(time.time() * 1000) - 60_000
+    bot.handle_kline_message(message)
+
+    assert bot.submitted == [("BTCUSDT", row(0)[3])]
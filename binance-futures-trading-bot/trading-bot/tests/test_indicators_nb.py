@@ -0,0 +1,85 @@
+"""Compiled numba kernels against the pandas / ta output they replace"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+pytest.importorskip("numba")
+
+import indicators_nb as nb
+from conftest import make_candles
+
+
+def assert_matches(actual, expected):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype=np.float64), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def random_frame():
+    return make_candles(7)
+
+
+def flat_frame(n=60, price=100.0):
+    """A market that didn't move: every high/low/close equal"""
+    values = np.full(n, price)
+    return pd.DataFrame({"open": values, "high": values, "low": values, "close": values, "volume": values})
+
+
+def columns(df):
+    return tuple(df[c].to_numpy(dtype=np.float64) for c in ("high", "low", "close"))
+
+
+def test_kernels_are_compiled():
+    assert nb.NUMBA_AVAILABLE
+    assert hasattr(nb.stoch_nb, "py_func")
+
+
+@pytest.mark.parametrize("make_frame", [random_frame, flat_frame], ids=["random", "flat"])
+def test_kernels_match_ta(make_frame):
+    df = make_frame()
+    high, low, close = columns(df)
+
+    assert_matches(nb.ewm_span_nb(close, 20), df["close"].ewm(span=20, adjust=False).mean())
+    assert_matches(nb.rsi_nb(close, 14), ta.momentum.RSIIndicator(df["close"], window=14).rsi())
+    assert_matches(
+        nb.macd_nb(close, 12, 26, 9),
+        ta.trend.MACD(df["close"], window_slow=26, window_fast=12, window_sign=9).macd_diff(),
+    )
+    assert_matches(
+        nb.stoch_nb(high, low, close, 14),
+        ta.momentum.StochasticOscillator(df["high"], df["low"], df["close"], window=14).stoch(),
+    )
+    assert_matches(nb.rolling_mean_nb(close, 20), df["close"].rolling(window=20).mean())
+    bands = ta.volatility.BollingerBands(df["close"], window=20, window_dev=2.0)
+    upper, lower, width = nb.bollinger_nb(close, 20, 2.0)
+    assert_matches(upper, bands.bollinger_hband())
+    assert_matches(lower, bands.bollinger_lband())
+    assert_matches(width, bands.bollinger_wband())
+    assert_matches(
+        nb.atr_nb(high, low, close, 14),
+        ta.volatility.AverageTrueRange(df["high"], df["low"], df["close"], window=14).average_true_range(),
+    )
+    assert_matches(
+        nb.adx_nb(high, low, close, 14),
+        ta.trend.ADXIndicator(df["high"], df["low"], df["close"], window=14).adx(),
+    )
+
+
+def test_flat_window_gives_nan_stochastic():
+    high, low, close = columns(flat_frame(30))
+    assert np.isnan(nb.stoch_nb(high, low, close, 14)).all()
+
+
+def test_zero_price_bollinger_width_is_nan():
+    _, _, width = nb.bollinger_nb(np.zeros(30), 20, 2.0)
+    assert np.isnan(width).all()
+
+
+def test_short_input():
+    high, low, close = columns(random_frame().iloc[:5])
+    np.testing.assert_array_equal(nb.atr_nb(high, low, close, 14), np.zeros(5))
+    assert np.isnan(nb.stoch_nb(high, low, close, 14)).all()
+    assert np.isnan(nb.rolling_mean_nb(close, 20)).all()
+    assert np.isnan(nb.bollinger_nb(close, 20, 2.0)[2]).all()
+    with pytest.raises(ValueError):
+        nb.adx_nb(high, low, close, 14)
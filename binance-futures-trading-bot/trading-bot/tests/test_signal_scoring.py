@@ -0,0 +1,106 @@
+"""Vectorized weighted-signal scorer against the original row-by-row scorer"""
+
+import copy
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+import indicators
+import reference_indicators
+from conftest import PARAMETERS_DIR, make_candles
+from indicators import IndicatorCalculator
+
+PARAM_FILES = sorted(PARAMETERS_DIR.glob("*_params.json"))
+
+
+def load_params(path, all_filters, time_filter=False):
+    params = json.loads(path.read_text())
+    weights = params["parameters"]
+    if all_filters:
+        # Switch every filter on so each scoring branch is exercised
+        for key in weights:
+            if key.endswith("_weight"):
+                weights[key] = max(weights[key], 0.3)
+    if not time_filter:
+        # Both scorers read the wall clock; only test_time_filter pins the hour
+        weights["time_filter_weight"] = 0.0
+    return params
+
+
+def freeze_hour(monkeypatch, hour):
+    """Make datetime.now() in both scorer modules report the given UTC hour"""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2024, 1, 1, hour, 30, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(indicators, "datetime", FrozenDatetime)
+    monkeypatch.setattr(reference_indicators, "datetime", FrozenDatetime)
+
+
+def assert_scores_match(params, entry_candles, trend_candles):
+    reference = reference_indicators.IndicatorCalculator("BTCUSDT", copy.deepcopy(params))
+    calc = IndicatorCalculator("BTCUSDT", params)
+
+    ref_entry = reference.calculate_all_indicators(entry_candles)
+    ref_trend = reference.calculate_all_indicators(trend_candles).iloc[-2].to_dict()
+    entry = calc.calculate_all_indicators(entry_candles)
+    trend = calc.calculate_all_indicators(trend_candles).iloc[-2].to_dict()
+
+    weighted_sum, filter_signals = calc.calculate_weighted_signal_vec(entry, trend)
+    for i in range(len(ref_entry)):
+        expected_sum, expected_filters = reference.calculate_weighted_signal(ref_entry.iloc[i], ref_trend)
+        assert weighted_sum[i] == pytest.approx(expected_sum, abs=1e-12), i
+        assert set(filter_signals) == set(expected_filters)
+        for name, expected in expected_filters.items():
+            assert filter_signals[name]["weight"] == expected["weight"]
+            assert filter_signals[name]["signal"][i] == pytest.approx(expected["signal"], abs=1e-12), (i, name)
+
+
+@pytest.mark.parametrize("all_filters", [False, True], ids=["tuned", "all-filters"])
+@pytest.mark.parametrize("param_file", PARAM_FILES, ids=lambda p: p.stem)
+def test_vectorized_scores_match_row_scorer(param_file, all_filters):
+    params = load_params(param_file, all_filters)
+    for seed in range(2):
+        assert_scores_match(params, make_candles(seed), make_candles(seed + 100))
+
+
+@pytest.mark.parametrize(
+    "coin, n",
+    [("bnbusdt", 40), ("bnbusdt", 60), ("btcusdt", 10), ("btcusdt", 20)],
+)
+def test_frames_shorter_than_lookback(coin, n):
+    # Fewer candles than sr_lookback, e.g. after a REST refill that returned little history
+    params = load_params(PARAMETERS_DIR / f"{coin}_params.json", all_filters=False)
+    assert n < params["parameters"]["sr_lookback"]
+    assert_scores_match(params, make_candles(5, n), make_candles(105, n))
+
+
+@pytest.mark.parametrize("hour", [0, 9, 16, 23])
+@pytest.mark.parametrize("param_file", PARAM_FILES, ids=lambda p: p.stem)
+def test_time_filter(param_file, hour, monkeypatch):
+    # Covers same-day and overnight trading windows, inside and outside them
+    freeze_hour(monkeypatch, hour)
+    params = load_params(param_file, all_filters=True, time_filter=True)
+    assert_scores_match(params, make_candles(7, 120), make_candles(107, 120))
+
+
+@pytest.mark.parametrize("param_file", PARAM_FILES[:3], ids=lambda p: p.stem)
+def test_delayed_entry_signal_matches_reference(param_file):
+    params = load_params(param_file, all_filters=True)
+    reference = reference_indicators.IndicatorCalculator("BTCUSDT", copy.deepcopy(params))
+    calc = IndicatorCalculator("BTCUSDT", params)
+
+    ref_entry = reference.calculate_all_indicators(make_candles(3))
+    ref_trend = reference.calculate_all_indicators(make_candles(103))
+    entry = calc.calculate_all_indicators(make_candles(3))
+    trend = calc.calculate_all_indicators(make_candles(103))
+
+    for cut in (60, 120, 200):
+        expected_side, expected_sum, _ = reference.get_entry_signal_delayed(ref_entry.iloc[:cut], ref_trend.iloc[:cut])
+        side, weighted_sum, _ = calc.get_entry_signal_delayed(entry.iloc[:cut], trend.iloc[:cut])
+        assert side == expected_side
+        assert np.isclose(weighted_sum, expected_sum, atol=1e-9)
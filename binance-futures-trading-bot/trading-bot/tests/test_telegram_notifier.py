@@ -0,0 +1,54 @@
+"""Telegram batching: message splitting and the per-message fallback"""
+
+from types import SimpleNamespace
+
+from telegram_notifier import MAX_MESSAGE_CHARS, TelegramNotifier
+
+
+class FakeSession:
+    """Records posted texts; rejects any text containing "<bad>" with a 400"""
+
+    def __init__(self):
+        self.sent = []
+
+    def post(self, url, data, timeout):
+        self.sent.append(data["text"])
+        status = 400 if "<bad>" in data["text"] else 200
+        return SimpleNamespace(status_code=status, ok=status == 200, text="")
+
+
+def make_notifier():
+    notifier = TelegramNotifier.__new__(TelegramNotifier)
+    notifier.base_url = "https://telegram.invalid/bot"
+    notifier.chat_id = "1"
+    notifier.http = FakeSession()
+    return notifier
+
+
+def test_small_messages_go_out_as_one_batch():
+    notifier = make_notifier()
+    notifier._send_batch(["a", "b", "c"])
+    assert notifier.http.sent == ["a\n\nb\n\nc"]
+
+
+def test_long_message_is_split_at_line_breaks():
+    line = "x" * 99
+    message = "\n".join([line] * 100)  # ~10k chars
+    pieces = TelegramNotifier._split_message(message)
+
+    assert len(pieces) > 1
+    assert all(len(piece) <= MAX_MESSAGE_CHARS for piece in pieces)
+    assert all(set(piece.split("\n")) == {line} for piece in pieces)
+    assert sum(piece.count(line) for piece in pieces) == 100
+
+
+def test_unbroken_long_message_is_cut_at_the_limit():
+    pieces = TelegramNotifier._split_message("x" * (MAX_MESSAGE_CHARS + 10))
+    assert [len(piece) for piece in pieces] == [MAX_MESSAGE_CHARS, 10]
+
+
+def test_rejected_batch_is_resent_one_message_at_a_time():
+    notifier = make_notifier()
+    notifier._send_batch(["entry alert", "<bad>", "exit alert"])
+    # Only the malformed message is lost
+    assert notifier.http.sent == ["entry alert\n\n<bad>\n\nexit alert", "entry alert", "<bad>", "exit alert"]
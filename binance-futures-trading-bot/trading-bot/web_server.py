@@ -11,6 +11,7 @@ import subprocess
 import sys
 import threading
 import time
+import webbrowser
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
@@ -2387,7 +2388,7 @@ HTML_TEMPLATE = '''
                 <div class="follower-row">
                     <div>
                         <div class="follower-label">${f.label}</div>
-                        <div class="follower-meta">${f.api_key} • ${f.active ? 'ACTIVE' : 'PAUSED'}</div>
+                        <div class="follower-meta">${f.api_key_masked} • ${f.active ? 'ACTIVE' : 'PAUSED'}</div>
                     </div>
                     <div class="follower-actions">
                         <button class="btn btn-copy btn-compact" onclick="toggleFollower('${f.id}')">${f.active ? 'Pause' : 'Resume'}</button>
@@ -2432,6 +2433,13 @@ if __name__ == '__main__':
 
     start_self_ping()
 
+    # RUN_BOT.py asks for the dashboard to be opened once the server is up
+    browser_url = os.getenv("OPEN_BROWSER_URL")
+    if browser_url:
+        browser_timer = threading.Timer(5.0, webbrowser.open, args=(browser_url,))
+        browser_timer.daemon = True
+        browser_timer.start()
+
     # Start the bot automatically when server starts
     start_bot()
 